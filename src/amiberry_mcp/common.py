@@ -5,9 +5,14 @@ Extracts duplicated logic into reusable helpers.
 
 import asyncio
 import datetime
+import functools
+import os
 import signal
+import stat
 import subprocess
 import time
+from collections.abc import Iterator
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -23,10 +28,18 @@ from .config import (
     SYSTEM_CONFIG_DIR,
 )
 
-# TTL-based cache for scan_disk_images results
-_scan_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+# TTL-based cache for scan_disk_images results: (timestamp, images, lowercase
+# names in the same order, used for search filtering)
+_scan_cache: dict[str, tuple[float, list[dict[str, Any]], list[str]]] = {}
 _SCAN_CACHE_TTL = 60.0  # seconds
 
+# Directory-mtime-validated cache for list_config_files results
+_config_list_cache: dict[str, tuple[int, list[Path]]] = {}
+# Files or directories modified more recently than this are not cached by
+# mtime (here and in rom_manager), since a second change within the
+# filesystem's mtime granularity is invisible.
+MTIME_SETTLE_NS = 2_000_000_000
+
 
 def _is_path_within(path: Path, parent: Path) -> bool:
     """Check that a resolved path is within the expected parent directory."""
@@ -51,33 +64,34 @@ def find_config_path(config_name: str) -> Path | None:
     return None
 
 
+# Image type -> extensions, in classification priority order
+_IMAGE_TYPE_EXTENSIONS: dict[str, list[str]] = {
+    "floppy": FLOPPY_EXTENSIONS,
+    "hardfile": HARDFILE_EXTENSIONS,
+    "lha": LHA_EXTENSIONS,
+    "cd": CD_EXTENSIONS,
+}
+
+# Lowercase suffix -> image type; built in reverse so earlier types win
+_SUFFIX_TO_TYPE: dict[str, str] = {
+    ext.lower(): image_type
+    for image_type, exts in reversed(_IMAGE_TYPE_EXTENSIONS.items())
+    for ext in exts
+}
+
+
 def classify_image_type(suffix: str) -> str:
     """Classify a disk image by its file extension."""
-    suffix_lower = suffix.lower()
-    if suffix_lower in FLOPPY_EXTENSIONS:
-        return "floppy"
-    elif suffix_lower in HARDFILE_EXTENSIONS:
-        return "hardfile"
-    elif suffix_lower in LHA_EXTENSIONS:
-        return "lha"
-    elif suffix_lower in CD_EXTENSIONS:
-        return "cd"
-    else:
-        return "unknown"
+    return _SUFFIX_TO_TYPE.get(suffix.lower(), "unknown")
 
 
 def get_extensions_for_type(image_type: str) -> list[str]:
     """Get file extensions for a given image type."""
-    if image_type == "floppy":
-        return FLOPPY_EXTENSIONS
-    elif image_type == "hardfile":
-        return HARDFILE_EXTENSIONS
-    elif image_type == "lha":
-        return LHA_EXTENSIONS
-    elif image_type == "cd":
-        return CD_EXTENSIONS
-    else:  # all
-        return FLOPPY_EXTENSIONS + HARDFILE_EXTENSIONS + LHA_EXTENSIONS + CD_EXTENSIONS
+    extensions = _IMAGE_TYPE_EXTENSIONS.get(image_type)
+    if extensions is not None:
+        return extensions
+    # all
+    return FLOPPY_EXTENSIONS + HARDFILE_EXTENSIONS + LHA_EXTENSIONS + CD_EXTENSIONS
 
 
 def build_launch_command(
@@ -185,15 +199,91 @@ def terminate_process(proc: subprocess.Popen, timeout: float = 5.0) -> None:
             pass
 
 
-def _get_cache_key(search_dirs: list[Path], image_type: str, search_term: str) -> str:
+def _get_cache_key(search_dirs: list[Path], image_type: str) -> str:
     """Generate a cache key from scan parameters."""
     dirs_str = ",".join(str(d) for d in search_dirs)
-    return f"{dirs_str}|{image_type}|{search_term}"
+    return f"{dirs_str}|{image_type}"
 
 
 def clear_scan_cache() -> None:
-    """Clear the scan cache. Useful for testing and manual invalidation."""
+    """Clear the scan caches. Useful for testing and manual invalidation."""
     _scan_cache.clear()
+    _config_list_cache.clear()
+    _read_config_cached.cache_clear()
+
+
+def iter_files_with_suffix(
+    root: Path,
+    suffixes: str | tuple[str, ...],
+    recursive: bool = False,
+    ignore_case: bool = False,
+) -> Iterator[os.DirEntry]:
+    """Yield regular files in ``root`` whose names end with one of ``suffixes``.
+
+    Walks with ``os.scandir`` so type checks and ``DirEntry.stat()`` come from
+    the directory entry instead of fresh ``Path`` objects. Symlinked
+    directories are not followed when recursing. Missing or unreadable
+    directories yield nothing. With ``ignore_case``, names are lowercased
+    before matching, so ``suffixes`` must be given in lowercase.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name.lower() if ignore_case else entry.name
+                    if name.endswith(suffixes) and entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+def list_config_files(directory: Path) -> list[Path]:
+    """List ``*.uae`` files in a directory, cached until the directory changes.
+
+    Adding, removing or renaming a config updates the directory mtime, which
+    invalidates the cached listing. Returns an empty list if the directory
+    does not exist.
+    """
+    try:
+        mtime = directory.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    key = str(directory)
+    cached = _config_list_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    files = [Path(entry.path) for entry in iter_files_with_suffix(directory, ".uae")]
+    if time.time_ns() - mtime > MTIME_SETTLE_NS:
+        _config_list_cache[key] = (mtime, files)
+    return files
+
+
+@functools.lru_cache(maxsize=64)
+def _read_config_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a config file; the stat fields in the key invalidate stale entries."""
+    return Path(path_str).read_text()
+
+
+def read_config_text(config_path: Path) -> str:
+    """Read a config file, reusing the previous read while it is unchanged.
+
+    Files modified too recently for their mtime to reveal another change are
+    always read from disk.
+    """
+    st = config_path.stat()
+    if time.time_ns() - st.st_mtime_ns <= MTIME_SETTLE_NS:
+        return config_path.read_text()
+    return _read_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
 
 
 def scan_disk_images(
@@ -204,61 +294,85 @@ def scan_disk_images(
     """Scan directories for disk images, with optional type filtering and search.
 
     Returns a deduplicated list of image info dicts sorted by name.
-    Uses targeted extension globs for performance and caches results with 60s TTL.
+    Walks each directory once, matching extensions case-insensitively. The
+    unfiltered scan is cached with 60s TTL and the search term is applied to
+    the cached list, so different searches share one walk.
     """
-    cache_key = _get_cache_key(search_dirs, image_type, search_term)
+    images, names_lower = _scan_all_disk_images(search_dirs, image_type)
+    if search_term:
+        search_lower = search_term.lower()
+        return [
+            img
+            for img, name_lower in zip(images, names_lower, strict=True)
+            if search_lower in name_lower
+        ]
+    return images
+
+
+def _scan_all_disk_images(
+    search_dirs: list[Path], image_type: str
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Walk search_dirs for all images of image_type, using the TTL cache.
+
+    Returns the sorted images and their lowercased names, in the same order.
+    """
+    cache_key = _get_cache_key(search_dirs, image_type)
     now = time.time()
 
     if cache_key in _scan_cache:
-        timestamp, cached_result = _scan_cache[cache_key]
+        timestamp, cached_images, cached_names = _scan_cache[cache_key]
         if now - timestamp < _SCAN_CACHE_TTL:
-            return cached_result
+            return cached_images, cached_names
 
     extensions = get_extensions_for_type(image_type)
     ext_set = {e.lower() for e in extensions}
-    search_lower = search_term.lower() if search_term else ""
 
+    # Only needed when callers pass overlapping search directories
     seen: set[str] = set()
-    images: list[dict[str, Any]] = []
+    entries: list[tuple[str, dict[str, Any]]] = []
 
     for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-        for ext in ext_set:
-            for img_path in search_dir.rglob(f"*{ext}"):
-                if not img_path.is_file():
+        for root, _dirs, files in os.walk(search_dir):
+            for name in files:
+                name_lower = name.lower()
+                dot = name_lower.rfind(".")
+                if dot < 0:
                     continue
-                path_str = str(img_path)
-                if path_str in seen:
+                suffix = name_lower[dot:]
+                if suffix not in ext_set:
                     continue
-                if search_lower and search_lower not in img_path.name.lower():
+                path_str = os.path.join(root, name)
+                if path_str in seen:
                     continue
                 seen.add(path_str)
                 try:
-                    file_size = img_path.stat().st_size
+                    st = os.stat(path_str)
                 except OSError:
                     continue
-                images.append(
-                    {
-                        "name": img_path.name,
-                        "path": path_str,
-                        "type": classify_image_type(img_path.suffix),
-                        "size": file_size,
-                    }
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                entries.append(
+                    (
+                        name_lower,
+                        {
+                            "name": name,
+                            "path": path_str,
+                            "type": classify_image_type(suffix),
+                            "size": st.st_size,
+                        },
+                    )
                 )
 
-    images.sort(key=lambda x: x["name"].lower())
-    _scan_cache[cache_key] = (now, images)
-    return images
+    entries.sort(key=itemgetter(0))
+    names_lower = [name_lower for name_lower, _ in entries]
+    images = [image for _, image in entries]
+    _scan_cache[cache_key] = (now, images, names_lower)
+    return images, names_lower
 
 
 def format_log_timestamp(mtime: float) -> str:
-    """Format a file modification time as a human-readable timestamp."""
-    return (
-        datetime.datetime.fromtimestamp(mtime, tz=datetime.timezone.utc)
-        .astimezone()
-        .strftime("%Y-%m-%d %H:%M:%S")
-    )
+    """Format a file modification time as a human-readable local timestamp."""
+    return datetime.datetime.fromtimestamp(mtime).isoformat(sep=" ", timespec="seconds")
 
 
 def normalize_log_path(log_name: str) -> Path:
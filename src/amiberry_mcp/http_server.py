@@ -18,6 +18,7 @@ import re
 import signal
 import subprocess
 from contextlib import asynccontextmanager as _asynccontextmanager
+from operator import itemgetter
 from pathlib import Path
 
 import uvicorn
@@ -31,7 +32,10 @@ from .common import (
     detect_amiberry_version,
     format_log_timestamp,
     format_signal_info,
+    iter_files_with_suffix,
+    list_config_files,
     normalize_log_path,
+    read_config_text,
     scan_disk_images,
     terminate_process,
 )
@@ -188,7 +192,7 @@ class RomInfo(BaseModel):
     filename: str
     size: int
     crc32: str
-    md5: str
+    md5: str | None
     identified: bool
     version: str | None = None
     revision: str | None = None
@@ -565,19 +569,14 @@ async def list_configs(include_system: bool = False):
     """List available Amiberry configuration files."""
 
     def _scan_configs() -> list[ConfigInfo]:
-        configs = []
         # User configs
-        if CONFIG_DIR.exists():
-            for f in CONFIG_DIR.glob("*.uae"):
-                configs.append(ConfigInfo(name=f.name, source="user", path=str(f)))
+        configs = [
+            ConfigInfo(name=f.name, source="user", path=str(f))
+            for f in list_config_files(CONFIG_DIR)
+        ]
         # System configs (Linux only)
-        if (
-            IS_LINUX
-            and include_system
-            and SYSTEM_CONFIG_DIR
-            and SYSTEM_CONFIG_DIR.exists()
-        ):
-            for f in SYSTEM_CONFIG_DIR.glob("*.uae"):
+        if IS_LINUX and include_system and SYSTEM_CONFIG_DIR:
+            for f in list_config_files(SYSTEM_CONFIG_DIR):
                 configs.append(ConfigInfo(name=f.name, source="system", path=str(f)))
         return configs
 
@@ -591,7 +590,7 @@ async def get_config(config_name: str):
     config_path = _require_config_path(config_name)
 
     try:
-        content = await asyncio.to_thread(config_path.read_text)
+        content = await asyncio.to_thread(read_config_text, config_path)
         return StatusResponse(
             success=True,
             message=f"Configuration: {config_name}",
@@ -631,14 +630,13 @@ async def list_savestates(search: str | None = None):
 
     def _scan_savestates() -> list[Savestate]:
         savestates = []
-        if SAVESTATE_DIR.exists():
-            for state in SAVESTATE_DIR.glob("**/*.uss"):
-                if not search_term or search_term in state.name.lower():
-                    mtime = state.stat().st_mtime
-                    timestamp = format_log_timestamp(mtime)
-                    savestates.append(
-                        Savestate(name=state.name, modified=timestamp, path=str(state))
-                    )
+        for state in iter_files_with_suffix(SAVESTATE_DIR, ".uss", recursive=True):
+            if not search_term or search_term in state.name.lower():
+                mtime = state.stat().st_mtime
+                timestamp = format_log_timestamp(mtime)
+                savestates.append(
+                    Savestate(name=state.name, modified=timestamp, path=state.path)
+                )
         return savestates
 
     savestates = await asyncio.to_thread(_scan_savestates)
@@ -698,7 +696,7 @@ async def launch_amiberry(request: LaunchRequest):
 
     try:
         # Launch in background
-        launch_and_store(cmd)
+        await asyncio.to_thread(launch_and_store, cmd)
 
         if request.model:
             message = f"Launched Amiberry with model: {request.model}"
@@ -822,7 +820,7 @@ async def launch_with_logging(request: LaunchWithLoggingRequest):
     )
 
     try:
-        launch_and_store(cmd, log_path=log_path)
+        await asyncio.to_thread(launch_and_store, cmd, log_path=log_path)
 
         return StatusResponse(
             success=True,
@@ -1012,7 +1010,7 @@ async def launch_whdload(
     )
 
     try:
-        launch_and_store(cmd)
+        await asyncio.to_thread(launch_and_store, cmd)
 
         return StatusResponse(
             success=True,
@@ -1081,7 +1079,7 @@ async def launch_cd(request: LaunchCDRequest):
     )
 
     try:
-        launch_and_store(cmd)
+        await asyncio.to_thread(launch_and_store, cmd)
 
         return StatusResponse(
             success=True,
@@ -1140,7 +1138,7 @@ async def launch_with_disk_swapper(request: DiskSwapperRequest):
     )
 
     try:
-        launch_and_store(cmd)
+        await asyncio.to_thread(launch_and_store, cmd)
 
         return StatusResponse(
             success=True,
@@ -1161,7 +1159,7 @@ async def list_logs():
 
     def _scan_logs():
         result = []
-        for log in LOG_DIR.glob("*.log"):
+        for log in iter_files_with_suffix(LOG_DIR, ".log"):
             st = log.stat()
             timestamp = format_log_timestamp(st.st_mtime)
             result.append(LogFile(name=log.name, modified=timestamp, size=st.st_size))
@@ -2935,7 +2933,10 @@ async def runtime_set_breakpoint(request: RuntimeSetBreakpointRequest):
     Set a breakpoint at a memory address. Maximum 20 breakpoints.
     """
     async with _ipc_context() as client:
-        success = await client.set_breakpoint(request.address)
+        try:
+            success = await client.set_breakpoint(request.address)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         return _ipc_success_or_raise(
             success,
             f"Breakpoint set at {request.address}",
@@ -2950,7 +2951,10 @@ async def runtime_clear_breakpoint(request: RuntimeClearBreakpointRequest):
     Clear a breakpoint at a specific address or all breakpoints (address='ALL').
     """
     async with _ipc_context() as client:
-        success = await client.clear_breakpoint(request.address)
+        try:
+            success = await client.clear_breakpoint(request.address)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         if request.address.upper() == "ALL":
             return _ipc_success_or_raise(
                 success,
@@ -3184,7 +3188,7 @@ async def restart_amiberry_process():
 
     cmd = _state.launch_cmd
     try:
-        launch_and_store(cmd, log_path=_state.log_path)
+        await asyncio.to_thread(launch_and_store, cmd, log_path=_state.log_path)
         return StatusResponse(
             success=True,
             message=f"Amiberry restarted (PID: {_state.process.pid})",
@@ -3500,13 +3504,14 @@ async def get_crash_info(request: GetCrashInfoRequest):
 
         def _find_latest_log() -> list[Path]:
             logs = []
-            for p in LOG_DIR.glob("*.log"):
+            for entry in iter_files_with_suffix(LOG_DIR, ".log"):
                 try:
-                    logs.append((p, p.stat().st_mtime))
+                    logs.append((Path(entry.path), entry.stat().st_mtime))
                 except OSError:
                     continue
-            logs.sort(key=lambda x: x[1], reverse=True)
-            return [p for p, _ in logs[:1]]
+            if not logs:
+                return []
+            return [max(logs, key=itemgetter(1))[0]]
 
         log_files_to_scan = await asyncio.to_thread(_find_latest_log)
 
@@ -3644,7 +3649,7 @@ async def launch_and_wait_for_ipc(request: LaunchAndWaitRequest):
     log_path = LOG_DIR / log_name
 
     try:
-        launch_and_store(cmd, log_path=log_path)
+        await asyncio.to_thread(launch_and_store, cmd, log_path=log_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error launching: {str(e)}") from e
 
@@ -9,9 +9,13 @@ The client automatically chooses the best available transport.
 """
 
 import asyncio
+import functools
 import importlib
 import os
+import re
 import sys
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 if not hasattr(asyncio, "open_unix_connection"):
@@ -98,6 +102,9 @@ def _safe_int(value: str, default: int = 0) -> int:
         return default
 
 
+_BOOL_STRINGS = {"true": True, "false": False}
+
+
 def _parse_kv_response(data: list[str], coerce_bools: bool = False) -> dict[str, Any]:
     """Parse a list of 'key=value' strings into a dictionary.
 
@@ -107,17 +114,89 @@ def _parse_kv_response(data: list[str], coerce_bools: bool = False) -> dict[str,
     """
     result: dict[str, Any] = {}
     for item in data:
-        if "=" in item:
-            key, value = item.split("=", 1)
-            if coerce_bools:
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
+        key, sep, value = item.partition("=")
+        if not sep:
+            continue
+        if coerce_bools:
+            result[key] = _BOOL_STRINGS.get(value.lower(), value)
+        else:
             result[key] = value
     return result
 
 
+# Breakpoint addresses: 0x-prefixed hex (up to 32 bits) or decimal
+_ADDRESS_RE = re.compile(r"0x[0-9a-f]{1,8}|[0-9]{1,10}", re.IGNORECASE)
+
+
+def _format_address(address: int | str) -> str:
+    """Format a breakpoint address for IPC, rejecting malformed strings.
+
+    Raises:
+        ValueError: If a string address is not hex (``0x...``) or decimal.
+    """
+    if isinstance(address, int):
+        return f"0x{address:x}"
+    addr_str = str(address).strip()
+    if not _ADDRESS_RE.fullmatch(addr_str):
+        raise ValueError(
+            f"Invalid address: '{address}'. Use hex (e.g. '0x400') or decimal"
+        )
+    return addr_str
+
+
+# Protocol delimiters stripped from arguments in a single C-level pass
+_ARG_STRIP_TABLE = str.maketrans("", "", "\t\n\r")
+
+# Socket errors that trigger a single reconnect-and-retry
+_RECONNECT_ERRORS = (
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionError,
+    asyncio.IncompleteReadError,
+)
+
+# Maximum accepted response line (prevents memory exhaustion)
+_MAX_RESPONSE_SIZE = 1024 * 1024
+
+# How long rarely-changing query results (CPU model, chipset, ...) are reused
+_QUERY_CACHE_TTL = 5.0
+
+
+def _copy_if_dict(value: Any) -> Any:
+    """Return a shallow copy of dict values; tuples and scalars are immutable."""
+    return dict(value) if isinstance(value, dict) else value
+
+
+def _async_ttl_cache(seconds: float = _QUERY_CACHE_TTL) -> Callable[..., Any]:
+    """Cache a no-argument client query per client instance for ``seconds``.
+
+    Failed or empty lookups (exceptions, ``None`` or ``{}``) are not cached.
+    Dict results are copied on the way in and out, so a caller mutating its
+    result cannot change what later callers see. Setters drop the matching
+    entry via ``AmiberryIPCClient._invalidate_cached``.
+    """
+
+    def decorator(
+        func: Callable[["AmiberryIPCClient"], Awaitable[Any]],
+    ) -> Callable[["AmiberryIPCClient"], Awaitable[Any]]:
+        key = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(self: "AmiberryIPCClient") -> Any:
+            now = time.monotonic()
+            entry = self._query_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return _copy_if_dict(entry[1])
+            value = await func(self)
+            if value:
+                self._query_cache[key] = (now + seconds, _copy_if_dict(value))
+            return value
+
+        return wrapper
+
+    return decorator
+
+
 # Mode lookup tables (avoid recreating per call)
 _SCALING_MODE_MAP = {"auto": -1, "nearest": 0, "linear": 1, "integer": 2}
 _LINE_MODE_MAP = {"single": 0, "none": 0, "double": 1, "doubled": 1, "scanlines": 2}
@@ -414,7 +493,7 @@ class AmiberryIPCClient:
 
     def __init__(
         self,
-        prefer_dbus: bool = True,
+        prefer_dbus: bool = False,
         socket_path: str | None = None,
         instance: int | None = None,
     ):
@@ -423,7 +502,7 @@ class AmiberryIPCClient:
 
         Args:
             prefer_dbus: If True and on Linux with D-Bus available, prefer D-Bus
-                        over Unix sockets. Set to False to always use sockets.
+                        over Unix sockets. Defaults to False (always use sockets).
             socket_path: Explicit socket path. If None, auto-discovers the first
                         available Amiberry instance.
             instance: Specific instance number to connect to. Overrides auto-discovery.
@@ -441,6 +520,16 @@ class AmiberryIPCClient:
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._connection_lock = asyncio.Lock()
+        self._query_cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[tuple[str, ...], asyncio.Task] = {}
+
+    def _invalidate_cached(self, *keys: str) -> None:
+        """Drop cached query results for ``keys`` (all results if none given)."""
+        if not keys:
+            self._query_cache.clear()
+            return
+        for key in keys:
+            self._query_cache.pop(key, None)
 
     async def __aenter__(self) -> "AmiberryIPCClient":
         return self
@@ -497,25 +586,19 @@ class AmiberryIPCClient:
         """Send a command over Unix socket and return the response."""
         socket_path = self._socket_path
 
-        if not os.path.exists(socket_path):
+        # Only stat the socket path when we have to open a new connection;
+        # a live connection already proves Amiberry is listening.
+        if self._writer is None and not os.path.exists(socket_path):
             raise IPCConnectionError(
                 f"Socket not found at {socket_path}. Is Amiberry running with USE_IPC_SOCKET?"
             )
 
         # Build message: COMMAND\tARG1\tARG2...\n
         # Sanitize arguments to prevent protocol injection via tab/newline
-        sanitized_args = [
-            str(a).replace("\t", "").replace("\n", "").replace("\r", "") for a in args
-        ]
-        parts = [command.upper()] + sanitized_args
-        message = "\t".join(parts) + "\n"
-
-        reconnect_errors = (
-            BrokenPipeError,
-            ConnectionResetError,
-            ConnectionError,
-            asyncio.IncompleteReadError,
+        message = "\t".join(
+            [command.upper(), *(str(a).translate(_ARG_STRIP_TABLE) for a in args)]
         )
+        payload = (message + "\n").encode("utf-8")
 
         async with self._connection_lock:
             first_reconnect_error: Exception | None = None
@@ -528,11 +611,10 @@ class AmiberryIPCClient:
                         raise IPCConnectionError("Socket connection is not available")
 
                     # Send command
-                    self._writer.write(message.encode("utf-8"))
+                    self._writer.write(payload)
                     await self._writer.drain()
 
                     # Read response (limit to 1MB to prevent memory exhaustion)
-                    _MAX_RESPONSE_SIZE = 1024 * 1024
                     response = await asyncio.wait_for(
                         self._reader.readline(), timeout=timeout
                     )
@@ -550,7 +632,7 @@ class AmiberryIPCClient:
 
                     return success, data
 
-                except reconnect_errors as e:
+                except _RECONNECT_ERRORS as e:
                     await self._close_socket_connection()
 
                     if first_reconnect_error is None:
@@ -629,6 +711,20 @@ class AmiberryIPCClient:
         else:
             return await self._send_socket_command(command, *args, timeout=timeout)
 
+    async def _send_coalesced(self, command: str, *args: str) -> tuple[bool, list[str]]:
+        """Send a read-only query, sharing one round-trip between concurrent callers.
+
+        If an identical query is already in flight, await its result instead of
+        queueing a duplicate request behind the connection lock.
+        """
+        key = (command, *args)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_command(command, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     # High-level API methods
 
     async def pause(self) -> bool:
@@ -650,6 +746,7 @@ class AmiberryIPCClient:
         """
         reset_type = "HARD" if hard else "SOFT"
         success, _ = await self._send_command("RESET", reset_type)
+        self._invalidate_cached()
         return success
 
     async def quit(self) -> bool:
@@ -686,6 +783,7 @@ class AmiberryIPCClient:
             state_file: Path to the savestate file (.uss)
         """
         success, _ = await self._send_command("LOADSTATE", state_file)
+        self._invalidate_cached()
         return success
 
     async def insert_floppy(self, drive: int, image_path: str) -> bool:
@@ -777,6 +875,7 @@ class AmiberryIPCClient:
             True if successful
         """
         success, _ = await self._send_command("SET_CONFIG", option, value)
+        self._invalidate_cached()
         return success
 
     async def load_config(self, config_path: str) -> bool:
@@ -790,6 +889,7 @@ class AmiberryIPCClient:
             True if successful
         """
         success, _ = await self._send_command("LOAD_CONFIG", config_path)
+        self._invalidate_cached()
         return success
 
     async def send_key(self, keycode: int, pressed: bool) -> bool:
@@ -981,6 +1081,7 @@ class AmiberryIPCClient:
             True if successful
         """
         success, _ = await self._send_command("TOGGLE_FULLSCREEN")
+        self._invalidate_cached("get_window_size")
         return success
 
     async def set_warp(self, enabled: bool) -> bool:
@@ -1144,6 +1245,7 @@ class AmiberryIPCClient:
         if not 0 <= slot <= 9:
             raise ValueError("Slot must be 0-9")
         success, _ = await self._send_command("QUICKLOAD", str(slot))
+        self._invalidate_cached()
         return success
 
     async def get_joyport_mode(self, port: int) -> tuple[int, str] | None:
@@ -1255,6 +1357,7 @@ class AmiberryIPCClient:
         if not 0 <= mode <= 2:
             raise ValueError("Mode must be 0-2")
         success, _ = await self._send_command("SET_DISPLAY_MODE", str(mode))
+        self._invalidate_cached("get_window_size")
         return success
 
     async def get_display_mode(self) -> tuple[int, str] | None:
@@ -1447,6 +1550,19 @@ class AmiberryIPCClient:
             return data[0] == "1", data[1]
         return None
 
+    async def get_disk_write_protect_status(self, drive: int) -> str | None:
+        """
+        Get the write protection status string for a floppy disk.
+
+        Args:
+            drive: Drive number (0-3)
+
+        Returns:
+            Status string, or None on error
+        """
+        result = await self.get_disk_write_protect(drive)
+        return result[1] if result is not None else None
+
     async def toggle_status_line(self) -> tuple[int, str] | None:
         """
         Toggle status line display.
@@ -1484,8 +1600,10 @@ class AmiberryIPCClient:
         if chipset.upper() not in valid:
             raise ValueError(f"Chipset must be one of: {valid}")
         success, _ = await self._send_command("SET_CHIPSET", chipset.upper())
+        self._invalidate_cached("get_chipset")
         return success
 
+    @_async_ttl_cache()
     async def get_chipset(self) -> tuple[int, str] | None:
         """
         Get current chipset.
@@ -1498,6 +1616,7 @@ class AmiberryIPCClient:
             return _safe_int(data[0]), data[1]
         return None
 
+    @_async_ttl_cache()
     async def get_memory_config(self) -> dict[str, str]:
         """
         Get memory configuration.
@@ -1540,6 +1659,7 @@ class AmiberryIPCClient:
         if size_kb not in valid_sizes:
             raise ValueError(f"Size must be one of: {valid_sizes}")
         success, _ = await self._send_command("SET_CHIP_MEM", str(size_kb))
+        self._invalidate_cached("get_memory_config")
         return success
 
     async def set_fast_mem(self, size_kb: int) -> bool:
@@ -1556,6 +1676,7 @@ class AmiberryIPCClient:
         if size_kb not in valid_sizes:
             raise ValueError(f"Size must be one of: {valid_sizes}")
         success, _ = await self._send_command("SET_FAST_MEM", str(size_kb))
+        self._invalidate_cached("get_memory_config")
         return success
 
     async def set_slow_mem(self, size_kb: int) -> bool:
@@ -1572,6 +1693,7 @@ class AmiberryIPCClient:
         if size_kb not in valid_sizes:
             raise ValueError(f"Size must be one of: {valid_sizes}")
         success, _ = await self._send_command("SET_SLOW_MEM", str(size_kb))
+        self._invalidate_cached("get_memory_config")
         return success
 
     async def set_z3_mem(self, size_mb: int) -> bool:
@@ -1588,8 +1710,10 @@ class AmiberryIPCClient:
         if size_mb not in valid_sizes:
             raise ValueError(f"Size must be one of: {valid_sizes}")
         success, _ = await self._send_command("SET_Z3_MEM", str(size_mb))
+        self._invalidate_cached("get_memory_config")
         return success
 
+    @_async_ttl_cache()
     async def get_cpu_model(self) -> dict[str, str]:
         """
         Get CPU model information.
@@ -1633,6 +1757,7 @@ class AmiberryIPCClient:
                 "Model must be one of: 68000, 68010, 68020, 68030, 68040, 68060"
             )
         success, _ = await self._send_command("SET_CPU_MODEL", model_str)
+        self._invalidate_cached("get_cpu_model")
         return success
 
     async def set_window_size(self, width: int, height: int) -> bool:
@@ -1651,8 +1776,10 @@ class AmiberryIPCClient:
         success, _ = await self._send_command(
             "SET_WINDOW_SIZE", str(width), str(height)
         )
+        self._invalidate_cached("get_window_size")
         return success
 
+    @_async_ttl_cache()
     async def get_window_size(self) -> dict[str, int]:
         """
         Get current window size.
@@ -1688,8 +1815,10 @@ class AmiberryIPCClient:
         if not -1 <= mode <= 2:
             raise ValueError("Mode must be -1..2 (auto, nearest, linear, integer)")
         success, _ = await self._send_command("SET_SCALING", str(mode))
+        self._invalidate_cached("get_scaling")
         return success
 
+    @_async_ttl_cache()
     async def get_scaling(self) -> dict[str, str]:
         """
         Get current scaling mode.
@@ -1723,8 +1852,10 @@ class AmiberryIPCClient:
         if not 0 <= mode <= 2:
             raise ValueError("Mode must be 0-2 (single, double, scanlines)")
         success, _ = await self._send_command("SET_LINE_MODE", str(mode))
+        self._invalidate_cached("get_line_mode")
         return success
 
+    @_async_ttl_cache()
     async def get_line_mode(self) -> dict[str, str]:
         """
         Get current line mode.
@@ -1759,8 +1890,10 @@ class AmiberryIPCClient:
         if not 0 <= mode <= 2:
             raise ValueError("Mode must be 0-2 (lores, hires, superhires)")
         success, _ = await self._send_command("SET_RESOLUTION", str(mode))
+        self._invalidate_cached("get_resolution")
         return success
 
+    @_async_ttl_cache()
     async def get_resolution(self) -> tuple[int, str] | None:
         """
         Get current resolution.
@@ -1963,12 +2096,11 @@ class AmiberryIPCClient:
 
         Returns:
             True if successful
-        """
-        if isinstance(address, int):
-            addr_str = f"0x{address:x}"
-        else:
-            addr_str = str(address)
 
+        Raises:
+            ValueError: If the address is malformed
+        """
+        addr_str = _format_address(address)
         success, _ = await self._send_command("SET_BREAKPOINT", addr_str)
         return success
 
@@ -1981,13 +2113,14 @@ class AmiberryIPCClient:
 
         Returns:
             True if successful
+
+        Raises:
+            ValueError: If the address is neither ALL nor a valid address
         """
-        if address is None or str(address).upper() == "ALL":
+        if address is None or str(address).strip().upper() == "ALL":
             addr_str = "ALL"
-        elif isinstance(address, int):
-            addr_str = f"0x{address:x}"
         else:
-            addr_str = str(address)
+            addr_str = _format_address(address)
 
         success, _ = await self._send_command("CLEAR_BREAKPOINT", addr_str)
         return success
@@ -2011,7 +2144,7 @@ class AmiberryIPCClient:
         Returns:
             Dictionary with Copper addresses and status, or None on error
         """
-        success, data = await self._send_command("GET_COPPER_STATE")
+        success, data = await self._send_coalesced("GET_COPPER_STATE")
         if not success:
             return None
 
@@ -2025,7 +2158,7 @@ class AmiberryIPCClient:
             Dictionary with Blitter status, channels, dimensions, addresses
             or None on error
         """
-        success, data = await self._send_command("GET_BLITTER_STATE")
+        success, data = await self._send_coalesced("GET_BLITTER_STATE")
         if not success:
             return None
 
@@ -2045,9 +2178,9 @@ class AmiberryIPCClient:
         if drive is not None:
             if not 0 <= drive <= 3:
                 raise ValueError("Drive must be 0-3")
-            success, data = await self._send_command("GET_DRIVE_STATE", str(drive))
+            success, data = await self._send_coalesced("GET_DRIVE_STATE", str(drive))
         else:
-            success, data = await self._send_command("GET_DRIVE_STATE")
+            success, data = await self._send_coalesced("GET_DRIVE_STATE")
 
         if not success:
             return None
@@ -2062,7 +2195,7 @@ class AmiberryIPCClient:
             Dictionary with audio channel status (volume, period, enabled)
             or None on error
         """
-        success, data = await self._send_command("GET_AUDIO_STATE")
+        success, data = await self._send_coalesced("GET_AUDIO_STATE")
         if not success:
             return None
 
@@ -2076,7 +2209,7 @@ class AmiberryIPCClient:
             Dictionary with DMA channel status (bitplane, sprite, audio, disk, copper, blitter)
             or None on error
         """
-        success, data = await self._send_command("GET_DMA_STATE")
+        success, data = await self._send_coalesced("GET_DMA_STATE")
         if not success:
             return None
 
@@ -2101,5 +2234,5 @@ async def send_ipc_command(
         Tuple of (success, response_data)
     """
     if client is None:
-        client = AmiberryIPCClient(prefer_dbus=False)
+        client = AmiberryIPCClient()
     return await client._send_command(command, *args)
@@ -3,11 +3,17 @@ ROM manager for Amiberry.
 Identifies and catalogs Amiga ROM files by checksum.
 """
 
+import functools
 import hashlib
+import os
+import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from .common import MTIME_SETTLE_NS, iter_files_with_suffix
+
 # Known Amiga ROM database (CRC32 -> ROM info)
 # These are the most common Kickstart ROMs
 KNOWN_ROMS = {
@@ -182,11 +188,42 @@ KNOWN_ROMS = {
 
 # ROM file extensions
 ROM_EXTENSIONS = [".rom", ".bin", ".a500", ".a600", ".a1200", ".a4000"]
+# Lowercase suffixes for the case-insensitive directory walk
+_ROM_SUFFIXES = tuple(e.lower() for e in ROM_EXTENSIONS)
 
+# KNOWN_ROMS grouped by image size (size -> CRC32 -> ROM info), so a lookup
+# only considers ROMs of the right size and a CRC32 collision on a file of
+# another size is not reported as a match.
+_ROMS_BY_SIZE: dict[int, dict[str, dict[str, Any]]] = {}
+for _crc, _info in KNOWN_ROMS.items():
+    _ROMS_BY_SIZE.setdefault(_info["size"], {})[_crc] = _info
+del _crc, _info
 
 # Maximum ROM file size to read (16MB - well above any real Amiga ROM)
 _MAX_ROM_SIZE = 16 * 1024 * 1024
 
+# Upper bound on threads used to hash files in scan_rom_directory
+_ROM_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _read_rom(path: Path) -> bytes:
+    """Read a ROM file, enforcing the size limit.
+
+    The read is bounded by the limit even if the file grows after the size
+    check, and a file truncated mid-read just comes back short.
+
+    Raises:
+        ValueError: If the file exceeds the maximum allowed size
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _MAX_ROM_SIZE:
+            data = f.read(_MAX_ROM_SIZE + 1)
+            size = len(data)
+    if size > _MAX_ROM_SIZE:
+        raise ValueError(f"ROM file too large ({size} bytes, max {_MAX_ROM_SIZE})")
+    return data
+
 
 def calculate_rom_crc32(path: Path) -> str:
     """
@@ -201,12 +238,7 @@ def calculate_rom_crc32(path: Path) -> str:
     Raises:
         ValueError: If the file exceeds the maximum allowed size
     """
-    if path.stat().st_size > _MAX_ROM_SIZE:
-        raise ValueError(
-            f"ROM file too large ({path.stat().st_size} bytes, max {_MAX_ROM_SIZE})"
-        )
-    data = path.read_bytes()
-    crc = zlib.crc32(data) & 0xFFFFFFFF
+    crc = zlib.crc32(_read_rom(path)) & 0xFFFFFFFF
     return f"{crc:08X}"
 
 
@@ -223,35 +255,64 @@ def calculate_rom_md5(path: Path) -> str:
     Raises:
         ValueError: If the file exceeds the maximum allowed size
     """
-    if path.stat().st_size > _MAX_ROM_SIZE:
-        raise ValueError(
-            f"ROM file too large ({path.stat().st_size} bytes, max {_MAX_ROM_SIZE})"
-        )
-    data = path.read_bytes()
-    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+    return hashlib.md5(_read_rom(path), usedforsecurity=False).hexdigest()
 
 
-def identify_rom(path: Path) -> dict[str, Any]:
+def _rom_digests(path: Path) -> tuple[int, str, str | None]:
+    """Return the size, CRC32 and MD5 of a ROM, hashing a single read.
+
+    The MD5 is only computed for files whose size matches a known ROM; for
+    anything else it is None, saving the more expensive of the two passes.
+    """
+    data = _read_rom(path)
+    crc32 = f"{zlib.crc32(data) & 0xFFFFFFFF:08X}"
+    md5 = None
+    if len(data) in _ROMS_BY_SIZE:
+        md5 = hashlib.md5(data, usedforsecurity=False).hexdigest()
+    return len(data), crc32, md5
+
+
+def identify_rom(path: Path, force: bool = False) -> dict[str, Any]:
     """
     Identify a ROM file by its checksum.
 
+    Results are cached by path, size and modification time, so rescanning an
+    unchanged ROM library skips hashing.
+
     Args:
         path: Path to the ROM file
+        force: Re-hash the file even if a cached result exists
 
     Returns:
         Dictionary with ROM information
     """
-    if not path.exists():
-        raise FileNotFoundError(f"ROM file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"ROM file not found: {path}") from None
 
-    file_size = path.stat().st_size
-    if file_size > _MAX_ROM_SIZE:
-        raise ValueError(f"ROM file too large ({file_size} bytes, max {_MAX_ROM_SIZE})")
+    if force or time.time_ns() - st.st_mtime_ns <= MTIME_SETTLE_NS:
+        return _identify_rom_uncached(path)
+    return dict(_identify_rom_cached(str(path), st.st_size, st.st_mtime_ns))
+
+
+def clear_rom_cache() -> None:
+    """Clear cached identify_rom results."""
+    _identify_rom_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _identify_rom_cached(path_str: str, size: int, mtime_ns: int) -> dict[str, Any]:
+    """Identify a ROM; the stat fields in the key invalidate stale entries."""
+    return _identify_rom_uncached(Path(path_str))
 
-    data = path.read_bytes()
-    file_size = len(data)
-    crc32 = f"{zlib.crc32(data) & 0xFFFFFFFF:08X}"
-    md5 = hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+def _identify_rom_uncached(path: Path) -> dict[str, Any]:
+    """Hash a ROM file and look it up in KNOWN_ROMS."""
+    try:
+        file_size, crc32, md5 = _rom_digests(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"ROM file not found: {path}") from None
 
     result: dict[str, Any] = {
         "file": str(path),
@@ -261,9 +322,9 @@ def identify_rom(path: Path) -> dict[str, Any]:
         "md5": md5,
     }
 
-    # Try to identify from known ROMs
-    if crc32 in KNOWN_ROMS:
-        known = KNOWN_ROMS[crc32]
+    # Try to identify from known ROMs of the same size
+    known = _ROMS_BY_SIZE.get(file_size, {}).get(crc32)
+    if known is not None:
         result["identified"] = True
         result["version"] = known["version"]
         result["revision"] = known["revision"]
@@ -294,36 +355,45 @@ def scan_rom_directory(directory: Path, recursive: bool = True) -> list[dict[str
     Returns:
         List of ROM information dictionaries
     """
-    if not directory.exists():
-        return []
-
-    ext_set = {e.lower() for e in ROM_EXTENSIONS}
-    roms = []
-    seen: set[str] = set()
-    glob_pattern = "**/*" if recursive else "*"
-
-    for rom_path in directory.glob(glob_pattern):
-        if not rom_path.is_file():
-            continue
-        if rom_path.suffix.lower() not in ext_set:
-            continue
-        path_str = str(rom_path)
-        if path_str in seen:
-            continue
-        seen.add(path_str)
-        try:
-            rom_info = identify_rom(rom_path)
-            roms.append(rom_info)
-        except Exception as e:
-            roms.append(
-                {
-                    "file": path_str,
-                    "filename": rom_path.name,
-                    "error": str(e),
-                }
-            )
-
-    return roms
+    rom_paths = [
+        Path(entry.path)
+        for entry in iter_files_with_suffix(
+            directory, _ROM_SUFFIXES, recursive=recursive, ignore_case=True
+        )
+    ]
+
+    if len(rom_paths) <= 1:
+        return [_identify_or_error(rom_path) for rom_path in rom_paths]
+
+    # zlib and hashlib release the GIL while hashing, so files hash in parallel
+    workers = min(len(rom_paths), _ROM_SCAN_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_identify_or_error, rom_paths))
+
+
+def _identify_or_error(rom_path: Path) -> dict[str, Any]:
+    """Identify a ROM, returning an error entry instead of raising."""
+    try:
+        return identify_rom(rom_path)
+    except Exception as e:
+        return {
+            "file": str(rom_path),
+            "filename": rom_path.name,
+            "error": str(e),
+        }
+
+
+# get_rom_summary templates, one per outcome of identify_rom
+_ROM_SUMMARY_TAIL = "Size: {size_kb} KB\nCRC32: {crc32}"
+_ROM_SUMMARY_IDENTIFIED = (
+    "ROM: {filename}\nKickstart {version} (Rev {revision})\nModel: {model}\n"
+    + _ROM_SUMMARY_TAIL
+)
+_ROM_SUMMARY_PROBABLE = (
+    "ROM: {filename}\nType: {probable_type} (unidentified)\n" + _ROM_SUMMARY_TAIL
+)
+_ROM_SUMMARY_UNKNOWN = "ROM: {filename}\n" + _ROM_SUMMARY_TAIL
+_ROM_SUMMARY_DEFAULTS = {"filename": "Unknown", "crc32": "Unknown"}
 
 
 def get_rom_summary(rom_info: dict[str, Any]) -> str:
@@ -336,61 +406,81 @@ def get_rom_summary(rom_info: dict[str, Any]) -> str:
     Returns:
         Formatted summary string
     """
-    lines = [f"ROM: {rom_info.get('filename', 'Unknown')}"]
-
     if rom_info.get("identified"):
-        lines.append(f"Kickstart {rom_info['version']} (Rev {rom_info['revision']})")
-        lines.append(f"Model: {rom_info['model']}")
+        template = _ROM_SUMMARY_IDENTIFIED
     elif rom_info.get("probable_type"):
-        lines.append(f"Type: {rom_info['probable_type']} (unidentified)")
+        template = _ROM_SUMMARY_PROBABLE
+    else:
+        template = _ROM_SUMMARY_UNKNOWN
+
+    return template.format_map(
+        {
+            **_ROM_SUMMARY_DEFAULTS,
+            **rom_info,
+            "size_kb": rom_info.get("size", 0) // 1024,
+        }
+    )
+
+
+# Models whose ROMs can stand in for each other, in order of preference
+_COMPATIBLE_MODELS = {
+    "A500": ["A500", "A1000", "A2000"],
+    "A500+": ["A500+", "A500"],
+    "A600": ["A600", "A500+"],
+    "A1200": ["A1200"],
+    "A3000": ["A3000", "A4000"],
+    "A4000": ["A4000", "A4000T", "A3000"],
+    "CD32": ["CD32"],
+    "CDTV": ["CDTV"],
+}
+
 
-    size_kb = rom_info.get("size", 0) // 1024
-    lines.append(f"Size: {size_kb} KB")
-    lines.append(f"CRC32: {rom_info.get('crc32', 'Unknown')}")
+def build_rom_index(roms: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Index identified ROMs by the models they support.
+
+    Multi-model entries such as "A500/A1000/A2000" are listed under each
+    model. Keys are uppercase and each list keeps the order of ``roms``.
+
+    Args:
+        roms: List of ROM info dictionaries
 
-    return "\n".join(lines)
+    Returns:
+        Dictionary mapping model names to matching ROM info dictionaries
+    """
+    index: dict[str, list[dict[str, Any]]] = {}
+    for rom in roms:
+        if rom.get("identified"):
+            rom_models = {m.strip().upper() for m in rom.get("model", "").split("/")}
+            for rom_model in rom_models:
+                index.setdefault(rom_model, []).append(rom)
+    return index
 
 
-def find_rom_for_model(roms: list[dict[str, Any]], model: str) -> dict[str, Any] | None:
+def find_rom_for_model(
+    roms: list[dict[str, Any]] | dict[str, list[dict[str, Any]]], model: str
+) -> dict[str, Any] | None:
     """
     Find the best ROM for a specific Amiga model from a list of ROMs.
 
     Args:
-        roms: List of ROM info dictionaries
+        roms: List of ROM info dictionaries, or an index from build_rom_index
+            to reuse across repeated lookups
         model: Amiga model (e.g., "A500", "A1200", "CD32")
 
     Returns:
         Best matching ROM info, or None if not found
     """
+    index = roms if isinstance(roms, dict) else build_rom_index(roms)
     model_upper = model.upper()
 
-    # First pass: exact model match (split on "/" for multi-model ROM entries)
-    for rom in roms:
-        if rom.get("identified"):
-            rom_models = {m.strip().upper() for m in rom.get("model", "").split("/")}
-            if model_upper in rom_models:
-                return rom
+    # First pass: exact model match
+    if model_upper in index:
+        return index[model_upper][0]
 
     # Second pass: compatible models
-    compatible = {
-        "A500": ["A500", "A1000", "A2000"],
-        "A500+": ["A500+", "A500"],
-        "A600": ["A600", "A500+"],
-        "A1200": ["A1200"],
-        "A3000": ["A3000", "A4000"],
-        "A4000": ["A4000", "A4000T", "A3000"],
-        "CD32": ["CD32"],
-        "CDTV": ["CDTV"],
-    }
-
-    if model_upper in compatible:
-        for compat_model in compatible[model_upper]:
-            for rom in roms:
-                if rom.get("identified"):
-                    rom_models = {
-                        m.strip().upper() for m in rom.get("model", "").split("/")
-                    }
-                    if compat_model in rom_models:
-                        return rom
+    for compat_model in _COMPATIBLE_MODELS.get(model_upper, ()):
+        if compat_model in index:
+            return index[compat_model][0]
 
     return None
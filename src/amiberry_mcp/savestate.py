@@ -3,9 +3,12 @@ Savestate (.uss) file parser for Amiberry.
 Reads metadata from Amiga savestate files without loading the full state.
 """
 
+import os
 import struct
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # ASF file format constants
 ASF_MAGIC = b"ASF "  # AmigaStateFile header
@@ -14,11 +17,19 @@ CHUNK_HEADER_SIZE = 8  # 4 bytes name + 4 bytes size
 # Pre-compiled struct formats to avoid repeated format string parsing
 _STRUCT_U32_BE = struct.Struct(">I")
 _STRUCT_U16_BE = struct.Struct(">H")
+_STRUCT_CHUNK_HEADER = struct.Struct(">4sI")
 
 
 # Maximum savestate file size to read (256MB - generous limit for any Amiga config)
 _MAX_SAVESTATE_SIZE = 256 * 1024 * 1024
 
+# Leading bytes read for the ASF header; its three strings are far shorter
+_HEADER_READ_SIZE = 64 * 1024
+
+# Chunk payload bytes read for parsing; the fields read are all near the
+# start, so RAM dumps are never read in full
+_CHUNK_PEEK_SIZE = 64 * 1024
+
 
 def _read_u32_be(data: bytes, offset: int) -> int:
     """Read a big-endian 32-bit unsigned integer."""
@@ -39,6 +50,61 @@ def _read_string(data: bytes, offset: int) -> tuple[str, int]:
     return string, end - offset + 1
 
 
+@contextmanager
+def _open_savestate(path: Path) -> Iterator[tuple[BinaryIO, int]]:
+    """Open a savestate file, enforcing the size limit.
+
+    Yields (file, size). Parsing reads only the header, the chunk headers
+    and a capped peek of each payload, so memory dumps are never read.
+    Plain reads also turn a file truncated mid-parse into short reads,
+    where a memory mapping would fault.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file exceeds the maximum allowed size
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Savestate file not found: {path}") from None
+    with f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size > _MAX_SAVESTATE_SIZE:
+            raise ValueError(
+                f"Savestate file too large ({file_size} bytes, max {_MAX_SAVESTATE_SIZE})"
+            )
+        yield f, file_size
+
+
+def _read_at(f: BinaryIO, offset: int, size: int) -> bytes:
+    """Read up to size bytes at offset; shorter if the file ends first."""
+    f.seek(offset)
+    return f.read(size)
+
+
+def _iter_chunks(
+    f: BinaryIO, offset: int, file_size: int
+) -> Iterator[tuple[str, int, int]]:
+    """Yield (name, offset, size) for each chunk, stopping after END.
+
+    Stops early at a truncated or malformed chunk header.
+    """
+    unpack_header = _STRUCT_CHUNK_HEADER.unpack
+    while offset + CHUNK_HEADER_SIZE <= file_size:
+        header = _read_at(f, offset, CHUNK_HEADER_SIZE)
+        if len(header) < CHUNK_HEADER_SIZE:
+            # File shrank since it was opened
+            return
+        raw_name, chunk_size = unpack_header(header)
+        if chunk_size < CHUNK_HEADER_SIZE or chunk_size > file_size - offset:
+            return
+        chunk_name = raw_name.decode("latin-1")
+        yield chunk_name, offset, chunk_size
+        if chunk_name == "END ":
+            return
+        offset += chunk_size
+
+
 def _parse_header(data: bytes) -> tuple[dict[str, Any], int]:
     """Parse the ASF header and return (metadata_dict, offset_to_first_chunk).
 
@@ -83,6 +149,80 @@ def _parse_header(data: bytes) -> tuple[dict[str, Any], int]:
     return metadata, offset
 
 
+# Chunk parsers used by inspect_savestate. Each takes the chunk name, the
+# start of its payload and the shared "cpu"/"rom"/"memory"/"disks" results.
+def _parse_cpu_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    cpu_model = _read_u32_be(data, 0)
+    parsed["cpu"]["model"] = f"68{cpu_model:03d}"
+    parsed["cpu"]["flags"] = _read_u32_be(data, 4)
+
+
+def _parse_fpu_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    fpu_model = _read_u32_be(data, 0)
+    if fpu_model > 0:
+        parsed["cpu"]["fpu"] = f"68{fpu_model:03d}"
+
+
+def _parse_chip_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    chipset_flags = _read_u32_be(data, 0)
+    chipset = "OCS"
+    if chipset_flags & 4:
+        chipset = "AGA"
+    elif chipset_flags & 3:
+        chipset = "ECS"
+    parsed["cpu"]["chipset"] = chipset
+
+
+def _parse_rom_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    rom_info = parsed["rom"]
+    rom_info["start"] = _read_u32_be(data, 0)
+    rom_info["size"] = _read_u32_be(data, 4)
+    rom_info["type"] = _read_u32_be(data, 8)
+    rom_info["flags"] = _read_u32_be(data, 12)
+    rom_info["version"] = _read_u16_be(data, 16)
+    rom_info["revision"] = _read_u16_be(data, 18)
+    if len(data) >= 24:
+        rom_info["crc"] = f"{_read_u32_be(data, 20):08X}"
+    # ROM ID string follows
+    if len(data) > 24:
+        rom_id, _ = _read_string(data, 24)
+        if rom_id:
+            rom_info["id"] = rom_id
+
+
+# Memory chunks -> key in the memory summary (Chip, Bogo/Slow, Fast, Z3 RAM)
+_MEMORY_CHUNKS = {"CRAM": "chip", "BRAM": "bogo", "FRAM": "fast", "ZRAM": "z3"}
+
+
+def _parse_memory_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    parsed["memory"][_MEMORY_CHUNKS[name]] = _read_u32_be(data, 4)
+
+
+def _parse_disk_chunk(name: str, data: bytes, parsed: dict[str, Any]) -> None:
+    # Floppy drive info
+    drive_info = {"drive": f"DF{name[3]}"}
+    drive_info["id"] = _read_u32_be(data, 0)
+    drive_info["state"] = data[4] if len(data) > 4 else 0
+    drive_info["track"] = data[5] if len(data) > 5 else 0
+    # Try to find disk image path
+    if len(data) > 20:
+        img_path, _ = _read_string(data, 20)
+        if img_path:
+            drive_info["image"] = img_path
+    parsed["disks"].append(drive_info)
+
+
+# Chunk name -> (minimum payload length, parser)
+_CHUNK_PARSERS: dict[str, tuple[int, Callable[[str, bytes, dict[str, Any]], None]]] = {
+    "CPU ": (8, _parse_cpu_chunk),
+    "FPU ": (4, _parse_fpu_chunk),
+    "CHIP": (4, _parse_chip_chunk),
+    "ROM ": (20, _parse_rom_chunk),
+    **dict.fromkeys(_MEMORY_CHUNKS, (8, _parse_memory_chunk)),
+    **{f"DSK{n}": (8, _parse_disk_chunk) for n in range(10)},
+}
+
+
 def inspect_savestate(path: Path) -> dict[str, Any]:
     """
     Inspect a savestate file and extract metadata.
@@ -97,130 +237,62 @@ def inspect_savestate(path: Path) -> dict[str, Any]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file is not a valid savestate
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Savestate file not found: {path}")
+    with _open_savestate(path) as (f, file_size):
+        return _inspect_file(path, f, file_size)
 
-    file_size = path.stat().st_size
-    if file_size > _MAX_SAVESTATE_SIZE:
-        raise ValueError(
-            f"Savestate file too large ({file_size} bytes, max {_MAX_SAVESTATE_SIZE})"
-        )
 
-    data = path.read_bytes()
-    header_meta, offset = _parse_header(data)
+def _inspect_file(path: Path, f: BinaryIO, file_size: int) -> dict[str, Any]:
+    """Extract savestate metadata from an open file (see inspect_savestate)."""
+    header_meta, offset = _parse_header(_read_at(f, 0, _HEADER_READ_SIZE))
 
     metadata: dict[str, Any] = {
         "file": str(path),
         "filename": path.name,
-        "size_bytes": len(data),
+        "size_bytes": file_size,
         **header_meta,
     }
 
     # Parse chunks to extract more info
     chunks = []
-    cpu_info = {}
-    rom_info = {}
-    memory_info = {"chip": 0, "bogo": 0, "fast": 0, "z3": 0}
-    disk_info = []
-
-    while offset + CHUNK_HEADER_SIZE <= len(data):
-        chunk_name = data[offset : offset + 4].decode("latin-1", errors="replace")
-        chunk_size = _read_u32_be(data, offset + 4)
-
-        if chunk_size < CHUNK_HEADER_SIZE or chunk_size > len(data) - offset:
-            break
+    parsed: dict[str, Any] = {
+        "cpu": {},
+        "rom": {},
+        "memory": {"chip": 0, "bogo": 0, "fast": 0, "z3": 0},
+        "disks": [],
+    }
 
-        chunk_data = data[offset + CHUNK_HEADER_SIZE : offset + chunk_size]
+    for chunk_name, chunk_offset, chunk_size in _iter_chunks(f, offset, file_size):
+        peek_size = min(chunk_size - CHUNK_HEADER_SIZE, _CHUNK_PEEK_SIZE)
+        chunk_data = _read_at(f, chunk_offset + CHUNK_HEADER_SIZE, peek_size)
         chunks.append({"name": chunk_name, "size": chunk_size})
 
         # Parse specific chunks
-        if chunk_name == "CPU " and len(chunk_data) >= 8:
-            cpu_model = _read_u32_be(chunk_data, 0)
-            cpu_info["model"] = f"68{cpu_model:03d}"
-            cpu_info["flags"] = _read_u32_be(chunk_data, 4)
-
-        elif chunk_name == "FPU " and len(chunk_data) >= 4:
-            fpu_model = _read_u32_be(chunk_data, 0)
-            if fpu_model > 0:
-                cpu_info["fpu"] = f"68{fpu_model:03d}"
-
-        elif chunk_name == "CHIP" and len(chunk_data) >= 4:
-            chipset_flags = _read_u32_be(chunk_data, 0)
-            chipset = "OCS"
-            if chipset_flags & 4:
-                chipset = "AGA"
-            elif chipset_flags & 3:
-                chipset = "ECS"
-            cpu_info["chipset"] = chipset
-
-        elif chunk_name == "ROM " and len(chunk_data) >= 20:
-            rom_info["start"] = _read_u32_be(chunk_data, 0)
-            rom_info["size"] = _read_u32_be(chunk_data, 4)
-            rom_info["type"] = _read_u32_be(chunk_data, 8)
-            rom_info["flags"] = _read_u32_be(chunk_data, 12)
-            rom_info["version"] = _read_u16_be(chunk_data, 16)
-            rom_info["revision"] = _read_u16_be(chunk_data, 18)
-            if len(chunk_data) >= 24:
-                rom_info["crc"] = f"{_read_u32_be(chunk_data, 20):08X}"
-            # ROM ID string follows
-            if len(chunk_data) > 24:
-                rom_id, _ = _read_string(chunk_data, 24)
-                if rom_id:
-                    rom_info["id"] = rom_id
-
-        elif chunk_name == "CRAM" and len(chunk_data) >= 8:
-            # Chip RAM
-            memory_info["chip"] = _read_u32_be(chunk_data, 4)
-
-        elif chunk_name == "BRAM" and len(chunk_data) >= 8:
-            # Bogo/Slow RAM
-            memory_info["bogo"] = _read_u32_be(chunk_data, 4)
-
-        elif chunk_name == "FRAM" and len(chunk_data) >= 8:
-            # Fast RAM
-            memory_info["fast"] = _read_u32_be(chunk_data, 4)
-
-        elif chunk_name == "ZRAM" and len(chunk_data) >= 8:
-            # Z3 RAM
-            memory_info["z3"] = _read_u32_be(chunk_data, 4)
-
-        elif chunk_name.startswith("DSK") and len(chunk_data) >= 8:
-            # Floppy drive info
-            drive_num = chunk_name[3]
-            if drive_num.isdigit():
-                drive_info = {"drive": f"DF{drive_num}"}
-                drive_info["id"] = _read_u32_be(chunk_data, 0)
-                drive_info["state"] = chunk_data[4] if len(chunk_data) > 4 else 0
-                drive_info["track"] = chunk_data[5] if len(chunk_data) > 5 else 0
-                # Try to find disk image path
-                if len(chunk_data) > 20:
-                    img_path, _ = _read_string(chunk_data, 20)
-                    if img_path:
-                        drive_info["image"] = img_path
-                disk_info.append(drive_info)
-
-        elif chunk_name == "END ":
-            break
-
-        offset += chunk_size
+        if chunk_name in _CHUNK_PARSERS:
+            min_size, parse = _CHUNK_PARSERS[chunk_name]
+            if len(chunk_data) >= min_size:
+                parse(chunk_name, chunk_data, parsed)
 
     # Add parsed info to metadata
-    if cpu_info:
-        metadata["cpu"] = cpu_info
-    if rom_info:
-        metadata["rom"] = rom_info
-    if any(v > 0 for v in memory_info.values()):
+    if parsed["cpu"]:
+        metadata["cpu"] = parsed["cpu"]
+    if parsed["rom"]:
+        metadata["rom"] = parsed["rom"]
+    if any(v > 0 for v in parsed["memory"].values()):
         # Convert to KB for readability
         metadata["memory"] = {
-            k: v // 1024 if v > 0 else 0 for k, v in memory_info.items()
+            k: v // 1024 if v > 0 else 0 for k, v in parsed["memory"].items()
         }
-    if disk_info:
-        metadata["disks"] = disk_info
+    if parsed["disks"]:
+        metadata["disks"] = parsed["disks"]
     metadata["chunks"] = [c["name"] for c in chunks]
 
     return metadata
 
 
+# Leading lines of get_savestate_summary, present for every savestate
+_SAVESTATE_SUMMARY_HEADER = "Savestate: {filename}\nSize: {size_kb:.1f} KB"
+
+
 def get_savestate_summary(metadata: dict[str, Any]) -> str:
     """
     Generate a human-readable summary from savestate metadata.
@@ -231,8 +303,14 @@ def get_savestate_summary(metadata: dict[str, Any]) -> str:
     Returns:
         Formatted summary string
     """
-    lines = [f"Savestate: {metadata.get('filename', 'Unknown')}"]
-    lines.append(f"Size: {metadata.get('size_bytes', 0) / 1024:.1f} KB")
+    lines = [
+        _SAVESTATE_SUMMARY_HEADER.format_map(
+            {
+                "filename": metadata.get("filename", "Unknown"),
+                "size_kb": metadata.get("size_bytes", 0) / 1024,
+            }
+        )
+    ]
 
     if metadata.get("description"):
         lines.append(f"Description: {metadata['description']}")
@@ -297,38 +375,20 @@ def list_savestate_chunks(path: Path) -> list[dict[str, Any]]:
     Returns:
         List of chunk info dictionaries
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Savestate file not found: {path}")
-
-    file_size = path.stat().st_size
-    if file_size > _MAX_SAVESTATE_SIZE:
-        raise ValueError(
-            f"Savestate file too large ({file_size} bytes, max {_MAX_SAVESTATE_SIZE})"
-        )
+    with _open_savestate(path) as (f, file_size):
+        return _list_chunks(f, file_size)
 
-    data = path.read_bytes()
-    _, offset = _parse_header(data)
-
-    chunks = []
-    while offset + CHUNK_HEADER_SIZE <= len(data):
-        chunk_name = data[offset : offset + 4].decode("latin-1", errors="replace")
-        chunk_size = _read_u32_be(data, offset + 4)
 
-        if chunk_size < CHUNK_HEADER_SIZE or chunk_size > len(data) - offset:
-            break
+def _list_chunks(f: BinaryIO, file_size: int) -> list[dict[str, Any]]:
+    """List the chunks of an open savestate (see list_savestate_chunks)."""
+    _, offset = _parse_header(_read_at(f, 0, _HEADER_READ_SIZE))
 
-        chunks.append(
-            {
-                "name": chunk_name,
-                "offset": offset,
-                "size": chunk_size,
-                "data_size": chunk_size - CHUNK_HEADER_SIZE,
-            }
-        )
-
-        if chunk_name == "END ":
-            break
-
-        offset += chunk_size
-
-    return chunks
+    return [
+        {
+            "name": chunk_name,
+            "offset": chunk_offset,
+            "size": chunk_size,
+            "data_size": chunk_size - CHUNK_HEADER_SIZE,
+        }
+        for chunk_name, chunk_offset, chunk_size in _iter_chunks(f, offset, file_size)
+    ]
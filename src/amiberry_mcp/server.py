@@ -11,7 +11,9 @@ import json
 import re
 import signal
 import subprocess
+from collections.abc import Awaitable, Callable, Iterable
 from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -32,7 +34,10 @@ from .common import (
     detect_amiberry_version,
     format_log_timestamp,
     format_signal_info,
+    iter_files_with_suffix,
+    list_config_files,
     normalize_log_path,
+    read_config_text,
     scan_disk_images,
     terminate_process,
 )
@@ -66,7 +71,12 @@ from .savestate import (
     get_savestate_summary,
     inspect_savestate,
 )
-from .shared_state import get_ipc_client, get_state, launch_and_store
+from .shared_state import (
+    close_ipc_client,
+    get_ipc_client,
+    get_state,
+    launch_and_store,
+)
 from .uae_config import (
     create_config_from_template,
     get_config_summary,
@@ -79,16 +89,33 @@ _state = get_state()
 app = Server("amiberry-emulator")
 
 
-def _text_result(msg: str) -> list[TextContent]:
-    """Wrap a string in the MCP TextContent return format."""
-    return [TextContent(type="text", text=msg)]
+def _format_kv(header: str, items: Iterable[tuple[Any, Any]]) -> str:
+    """Format a header followed by one indented ``key: value`` line per item."""
+    return "".join([header, *(f"  {key}: {value}\n" for key, value in items)])
+
+
+def _tc(text: str) -> TextContent:
+    """Build a TextContent without re-running Pydantic validation on our own str."""
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _text_result(msg: str | TextContent | list[TextContent]) -> list[TextContent]:
+    """Wrap a string (or pre-built TextContent) in the MCP return format.
+
+    A list of TextContent blocks is passed through unchanged.
+    """
+    if isinstance(msg, list):
+        return msg
+    if isinstance(msg, TextContent):
+        return [msg]
+    return [_tc(msg)]
 
 
 async def _ipc_bool_call(
     method_name: str,
     *args: Any,
-    success_msg: str,
-    failure_msg: str,
+    success_msg: str | TextContent,
+    failure_msg: str | TextContent,
 ) -> list[TextContent]:
     """Call a boolean-returning IPC method with standard error handling."""
 
@@ -108,7 +135,9 @@ async def _ipc_call(
 ) -> list[TextContent]:
     """Call an IPC callback with standard error handling.
 
-    The callback receives the IPC client and should return a string result.
+    The callback receives the IPC client and should return a string result
+    (or a pre-built TextContent for constant messages, or a list of
+    TextContent blocks for large chunked output).
     """
     try:
         client = get_ipc_client()
@@ -170,6 +199,26 @@ _NO_ARG_BOOL_HANDLERS: dict[str, tuple[str, str, str]] = {
     ),
 }
 
+# The messages above never change, so build their TextContent objects once.
+_NO_ARG_BOOL_RESULTS: dict[str, tuple[str, TextContent, TextContent]] = {
+    name: (
+        method,
+        _tc(success),
+        _tc(failure),
+    )
+    for name, (method, success, failure) in _NO_ARG_BOOL_HANDLERS.items()
+}
+
+_STATUS_LINE_FAILED = _tc("Failed to toggle status line.")
+_ALL_BREAKPOINTS_CLEARED = _tc("All breakpoints cleared.")
+_CLEAR_BREAKPOINT_FAILED = _tc("Failed to clear breakpoint.")
+_NO_BREAKPOINTS = _tc("No active breakpoints.")
+_COPPER_STATE_FAILED = _tc("Failed to get Copper state.")
+_BLITTER_STATE_FAILED = _tc("Failed to get Blitter state.")
+_DRIVE_STATE_FAILED = _tc("Failed to get drive state.")
+_AUDIO_STATE_FAILED = _tc("Failed to get audio state.")
+_DMA_STATE_FAILED = _tc("Failed to get DMA state.")
+
 _ARG_BOOL_HANDLERS: dict[str, tuple[str, tuple[str, ...], dict[str, Any], str, str]] = {
     "runtime_screenshot": (
         "screenshot",
@@ -340,7 +389,7 @@ _SIMPLE_QUERY_HANDLERS: dict[str, tuple[str, str, str]] = {
 
 
 async def _handle_no_arg_bool(tool_name: str, arguments: Any) -> list:
-    method, success, failure = _NO_ARG_BOOL_HANDLERS[tool_name]
+    method, success, failure = _NO_ARG_BOOL_RESULTS[tool_name]
     return await _ipc_bool_call(method, success_msg=success, failure_msg=failure)
 
 
@@ -1933,6 +1982,14 @@ async def list_tools() -> list[Tool]:
                 "properties": {},
             },
         ),
+        Tool(
+            name="runtime_dump_all_state",
+            description="Get Copper, Blitter, DMA, audio and drive state in one call.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            },
+        ),
         # === Process Lifecycle Management ===
         Tool(
             name="check_process_alive",
@@ -2166,11 +2223,18 @@ async def list_tools() -> list[Tool]:
 # ---- Tool handler functions ----
 
 
+# Platform paths are fixed at import time, so the rendered text never changes.
+_PLATFORM_INFO_RESULT: TextContent | None = None
+
+
 async def _handle_get_platform_info(arguments: Any) -> list:
     """Handle get_platform_info tool."""
-    info = get_platform_info()
-    lines = [f"{key}: {value}" for key, value in info.items()]
-    return _text_result("\n".join(lines))
+    global _PLATFORM_INFO_RESULT
+    if _PLATFORM_INFO_RESULT is None:
+        info = get_platform_info()
+        lines = [f"{key}: {value}" for key, value in info.items()]
+        _PLATFORM_INFO_RESULT = _tc("\n".join(lines))
+    return _text_result(_PLATFORM_INFO_RESULT)
 
 
 async def _handle_list_configs(arguments: Any) -> list:
@@ -2178,19 +2242,14 @@ async def _handle_list_configs(arguments: Any) -> list:
     include_system = arguments.get("include_system", False)
 
     def _scan_configs():
-        configs = []
         # User configs
-        if CONFIG_DIR.exists():
-            user_configs = [(f.name, "user", str(f)) for f in CONFIG_DIR.glob("*.uae")]
-            configs.extend(user_configs)
+        configs = [(f.name, "user", str(f)) for f in list_config_files(CONFIG_DIR)]
 
         # System configs (Linux only)
-        if IS_LINUX and include_system:
-            if SYSTEM_CONFIG_DIR and SYSTEM_CONFIG_DIR.exists():
-                sys_configs = [
-                    (f.name, "system", str(f)) for f in SYSTEM_CONFIG_DIR.glob("*.uae")
-                ]
-                configs.extend(sys_configs)
+        if IS_LINUX and include_system and SYSTEM_CONFIG_DIR:
+            configs.extend(
+                (f.name, "system", str(f)) for f in list_config_files(SYSTEM_CONFIG_DIR)
+            )
         return configs
 
     configs = await asyncio.to_thread(_scan_configs)
@@ -2198,23 +2257,24 @@ async def _handle_list_configs(arguments: Any) -> list:
     if not configs:
         return _text_result("No configuration files found.")
 
-    result = f"Found {len(configs)} configuration(s):\n\n"
-    for cfg_name, source, path in sorted(configs):
-        result += f"- {cfg_name} ({source})\n  Path: {path}\n"
-
-    return _text_result(result)
+    parts = [f"Found {len(configs)} configuration(s):\n\n"]
+    parts.extend(
+        f"- {cfg_name} ({source})\n  Path: {path}\n"
+        for cfg_name, source, path in sorted(configs, key=itemgetter(0, 1))
+    )
+    return _text_result("".join(parts))
 
 
 async def _handle_get_config_content(arguments: Any) -> list:
     """Handle get_config_content tool."""
     config_name = arguments["config_name"]
-    config_path = _find_config_path(config_name)
+    config_path = await asyncio.to_thread(_find_config_path, config_name)
 
     if not config_path:
         return _text_result(f"Error: Configuration '{config_name}' not found")
 
     try:
-        content = await asyncio.to_thread(config_path.read_text)
+        content = await asyncio.to_thread(read_config_text, config_path)
         return _text_result(f"Configuration: {config_name}\n\n{content}")
     except (FileNotFoundError, PermissionError, OSError) as e:
         return _text_result(f"Error reading config: {str(e)}")
@@ -2237,11 +2297,11 @@ async def _handle_list_disk_images(arguments: Any) -> list:
             msg += f' matching "{search_term}"'
         return _text_result(f"{msg}.")
 
-    result = f"Found {len(images)} disk image(s):\n\n"
-    for img in images:
-        result += f"- {img['name']} ({img['type']})\n  {img['path']}\n"
-
-    return _text_result(result)
+    parts = [f"Found {len(images)} disk image(s):\n\n"]
+    parts.extend(
+        f"- {img['name']} ({img['type']})\n  {img['path']}\n" for img in images
+    )
+    return _text_result("".join(parts))
 
 
 async def _handle_launch_amiberry(arguments: Any) -> list:
@@ -2250,6 +2310,7 @@ async def _handle_launch_amiberry(arguments: Any) -> list:
     model = arguments.get("model")
     config = arguments.get("config")
     lha_file = arguments.get("lha_file")
+    disk_image = arguments.get("disk_image")
 
     # Validate that at least one of model, config, or lha_file is specified
     if not model and not config and not lha_file:
@@ -2260,43 +2321,42 @@ async def _handle_launch_amiberry(arguments: Any) -> list:
     # Resolve config path if specified
     config_path = None
     if config:
-        config_path = _find_config_path(config)
+        config_path = await asyncio.to_thread(_find_config_path, config)
         if not config_path:
             return _text_result(f"Error: Configuration '{config}' not found")
 
     # Validate LHA file
-    if lha_file:
-        lha_path = Path(lha_file)
-        if not await asyncio.to_thread(lha_path.exists):
-            return _text_result(f"Error: LHA file not found: {lha_file}")
+    lha_path = Path(lha_file) if lha_file else None
+    if lha_path and not await asyncio.to_thread(lha_path.exists):
+        return _text_result(f"Error: LHA file not found: {lha_file}")
 
     cmd = build_launch_command(
         model=model,
         config_path=config_path,
-        disk_image=arguments.get("disk_image"),
+        disk_image=disk_image,
         lha_file=lha_file,
         autostart=arguments.get("autostart", True),
     )
 
     try:
-        proc = launch_and_store(cmd)
+        proc = await asyncio.to_thread(launch_and_store, cmd)
 
         if model:
             result = f"Launched Amiberry with model: {model}"
         elif config:
             result = f"Launched Amiberry with config: {config}"
-        elif lha_file:
-            result = f"Launched Amiberry with LHA: {Path(lha_file).name}"
+        elif lha_path:
+            result = f"Launched Amiberry with LHA: {lha_path.name}"
         else:
             result = "Launched Amiberry"
 
         result += f"\n  PID: {proc.pid}"
 
-        if "disk_image" in arguments and arguments["disk_image"]:
-            result += f"\n  Disk in DF0: {Path(arguments['disk_image']).name}"
+        if disk_image:
+            result += f"\n  Disk in DF0: {Path(disk_image).name}"
 
-        if lha_file and (model or config):
-            result += f"\n  LHA: {Path(lha_file).name}"
+        if lha_path and (model or config):
+            result += f"\n  LHA: {lha_path.name}"
 
         return _text_result(result)
     except (FileNotFoundError, PermissionError, OSError, ValueError) as e:
@@ -2311,9 +2371,7 @@ async def _handle_list_savestates(arguments: Any) -> list:
 
     def _scan_savestates():
         results = []
-        if not SAVESTATE_DIR.exists():
-            return results
-        for state in SAVESTATE_DIR.glob("**/*.uss"):
+        for state in iter_files_with_suffix(SAVESTATE_DIR, ".uss", recursive=True):
             if not search_term or search_term in state.name.lower():
                 try:
                     mtime = state.stat().st_mtime
@@ -2322,7 +2380,7 @@ async def _handle_list_savestates(arguments: Any) -> list:
                 timestamp = format_log_timestamp(mtime)
                 results.append(
                     {
-                        "path": str(state),
+                        "path": state.path,
                         "name": state.name,
                         "modified": timestamp,
                     }
@@ -2337,11 +2395,12 @@ async def _handle_list_savestates(arguments: Any) -> list:
             msg += f' matching "{search_term}"'
         return _text_result(f"{msg}.")
 
-    result = f"Found {len(savestates)} savestate(s):\n\n"
-    for state in sorted(savestates, key=lambda x: x["name"]):
-        result += f"- {state['name']}\n  Modified: {state['modified']}\n  Path: {state['path']}\n"
-
-    return _text_result(result)
+    parts = [f"Found {len(savestates)} savestate(s):\n\n"]
+    parts.extend(
+        f"- {state['name']}\n  Modified: {state['modified']}\n  Path: {state['path']}\n"
+        for state in sorted(savestates, key=itemgetter("name"))
+    )
+    return _text_result("".join(parts))
 
 
 async def _handle_launch_with_logging(arguments: Any) -> list:
@@ -2372,7 +2431,7 @@ async def _handle_launch_with_logging(arguments: Any) -> list:
     # Resolve config path if specified
     config_path = None
     if config:
-        config_path = _find_config_path(config)
+        config_path = await asyncio.to_thread(_find_config_path, config)
         if not config_path:
             return _text_result(f"Error: Configuration '{config}' not found")
 
@@ -2392,7 +2451,7 @@ async def _handle_launch_with_logging(arguments: Any) -> list:
     )
 
     try:
-        proc = launch_and_store(cmd, log_path=log_path)
+        proc = await asyncio.to_thread(launch_and_store, cmd, log_path=log_path)
 
         result = "Launched Amiberry with logging enabled\n"
         result += f"PID: {proc.pid}\n"
@@ -2411,7 +2470,7 @@ async def _handle_launch_with_logging(arguments: Any) -> list:
 async def _handle_parse_config(arguments: Any) -> list:
     """Handle parse_config tool."""
     config_name = arguments["config_name"]
-    config_path = _find_config_path(config_name)
+    config_path = await asyncio.to_thread(_find_config_path, config_name)
 
     if not config_path:
         return _text_result(f"Error: Configuration '{config_name}' not found")
@@ -2459,7 +2518,7 @@ async def _handle_modify_config(arguments: Any) -> list:
     """Handle modify_config tool."""
     config_name = arguments["config_name"]
     modifications = arguments["modifications"]
-    config_path = _find_config_path(config_name)
+    config_path = await asyncio.to_thread(_find_config_path, config_name)
 
     if not config_path:
         return _text_result(f"Error: Configuration '{config_name}' not found")
@@ -2549,15 +2608,15 @@ async def _handle_launch_whdload(arguments: Any) -> list:
             return _text_result(f"No WHDLoad games found matching '{search_term}'")
 
         if len(lha_files) > 1:
-            result = f"Found {len(lha_files)} matches for '{search_term}':\n\n"
-            for lha in sorted(lha_files, key=lambda x: x.name.lower())[:10]:
-                result += f"- {lha.name}\n  {lha}\n"
+            parts = [f"Found {len(lha_files)} matches for '{search_term}':\n\n"]
+            # scan_disk_images already returns results sorted by name
+            parts.extend(f"- {lha.name}\n  {lha}\n" for lha in lha_files[:10])
             if len(lha_files) > 10:
-                result += f"\n... and {len(lha_files) - 10} more"
-            result += (
+                parts.append(f"\n... and {len(lha_files) - 10} more")
+            parts.append(
                 "\n\nPlease specify exact_path or use a more specific search term."
             )
-            return _text_result(result)
+            return _text_result("".join(parts))
 
         lha_path = lha_files[0]
     else:
@@ -2572,7 +2631,7 @@ async def _handle_launch_whdload(arguments: Any) -> list:
     )
 
     try:
-        proc = launch_and_store(cmd)
+        proc = await asyncio.to_thread(launch_and_store, cmd)
 
         return _text_result(
             f"Launched WHDLoad game: {lha_path.name}\nModel: {model}\nPID: {proc.pid}"
@@ -2611,15 +2670,15 @@ async def _handle_launch_cd(arguments: Any) -> list:
             return _text_result(f"No CD images found matching '{search_term}'")
 
         if len(cd_files) > 1:
-            result = f"Found {len(cd_files)} CD images matching '{search_term}':\n\n"
-            for cd in sorted(cd_files, key=lambda x: x.name.lower())[:10]:
-                result += f"- {cd.name}\n  {cd}\n"
+            parts = [f"Found {len(cd_files)} CD images matching '{search_term}':\n\n"]
+            # scan_disk_images already returns results sorted by name
+            parts.extend(f"- {cd.name}\n  {cd}\n" for cd in cd_files[:10])
             if len(cd_files) > 10:
-                result += f"\n... and {len(cd_files) - 10} more"
-            result += (
+                parts.append(f"\n... and {len(cd_files) - 10} more")
+            parts.append(
                 "\n\nPlease specify cd_image path or use a more specific search term."
             )
-            return _text_result(result)
+            return _text_result("".join(parts))
 
         cd_path = cd_files[0]
     else:
@@ -2634,7 +2693,7 @@ async def _handle_launch_cd(arguments: Any) -> list:
     )
 
     try:
-        proc = launch_and_store(cmd)
+        proc = await asyncio.to_thread(launch_and_store, cmd)
 
         return _text_result(
             f"Launched CD image: {cd_path.name}\nModel: {model}\nPID: {proc.pid}"
@@ -2670,7 +2729,7 @@ async def _handle_set_disk_swapper(arguments: Any) -> list:
     # Resolve config path if specified
     config_path = None
     if config:
-        config_path = _find_config_path(config)
+        config_path = await asyncio.to_thread(_find_config_path, config)
         if not config_path:
             return _text_result(f"Error: Configuration '{config}' not found")
 
@@ -2683,7 +2742,7 @@ async def _handle_set_disk_swapper(arguments: Any) -> list:
     )
 
     try:
-        proc = launch_and_store(cmd)
+        proc = await asyncio.to_thread(launch_and_store, cmd)
 
         result = f"Launched with disk swapper ({len(verified_paths)} disks):\n"
         result += f"  PID: {proc.pid}\n"
@@ -2713,11 +2772,9 @@ async def _handle_list_cd_images(arguments: Any) -> list:
             msg += f' matching "{search_term}"'
         return _text_result(f"{msg}.")
 
-    result = f"Found {len(cd_files)} CD image(s):\n\n"
-    for cd in cd_files:
-        result += f"- {cd['name']} ({cd['type']})\n  {cd['path']}\n"
-
-    return _text_result(result)
+    parts = [f"Found {len(cd_files)} CD image(s):\n\n"]
+    parts.extend(f"- {cd['name']} ({cd['type']})\n  {cd['path']}\n" for cd in cd_files)
+    return _text_result("".join(parts))
 
 
 async def _handle_get_log_content(arguments: Any) -> list:
@@ -2758,7 +2815,7 @@ async def _handle_list_logs(arguments: Any) -> list:
         if not LOG_DIR.exists():
             return None
         result = []
-        for log in LOG_DIR.glob("*.log"):
+        for log in iter_files_with_suffix(LOG_DIR, ".log"):
             try:
                 st = log.stat()
             except OSError:
@@ -2781,14 +2838,14 @@ async def _handle_list_logs(arguments: Any) -> list:
     if not logs:
         return _text_result("No log files found.")
 
-    result = f"Found {len(logs)} log file(s):\n\n"
-    for log in sorted(logs, key=lambda x: x["modified"], reverse=True):
+    parts = [f"Found {len(logs)} log file(s):\n\n"]
+    for log in sorted(logs, key=itemgetter("modified"), reverse=True):
         size_str = f"{log['size']} bytes"
         if log["size"] > 1024:
             size_str = f"{log['size'] / 1024:.1f} KB"
-        result += f"- {log['name']}\n  Modified: {log['modified']} ({size_str})\n"
+        parts.append(f"- {log['name']}\n  Modified: {log['modified']} ({size_str})\n")
 
-    return _text_result(result)
+    return _text_result("".join(parts))
 
 
 # Phase 2 tools
@@ -2844,21 +2901,26 @@ async def _handle_list_roms(arguments: Any) -> list:
                 f"No ROM files found in {rom_dir}\n\nAdd Kickstart ROM files (.rom, .bin) to this directory."
             )
 
-        result = f"Found {len(roms)} ROM file(s) in {rom_dir}:\n\n"
+        parts = [f"Found {len(roms)} ROM file(s) in {rom_dir}:\n\n"]
+        # Case-insensitive order needs a computed key, so this one stays a lambda
         for rom in sorted(roms, key=lambda x: x.get("filename", "").lower()):
             if rom.get("error"):
-                result += f"- {rom['filename']}: Error - {rom['error']}\n"
+                parts.append(f"- {rom['filename']}: Error - {rom['error']}\n")
             elif rom.get("identified"):
-                result += f"- {rom['filename']}\n"
-                result += f"  Kickstart {rom['version']} (Rev {rom['revision']})\n"
-                result += f"  Model: {rom['model']}\n"
-                result += f"  CRC32: {rom['crc32']}\n"
+                parts.append(
+                    f"- {rom['filename']}\n"
+                    f"  Kickstart {rom['version']} (Rev {rom['revision']})\n"
+                    f"  Model: {rom['model']}\n"
+                    f"  CRC32: {rom['crc32']}\n"
+                )
             else:
-                result += f"- {rom['filename']}\n"
-                result += f"  {rom.get('probable_type', 'Unknown type')}\n"
-                result += f"  CRC32: {rom['crc32']}\n"
+                parts.append(
+                    f"- {rom['filename']}\n"
+                    f"  {rom.get('probable_type', 'Unknown type')}\n"
+                    f"  CRC32: {rom['crc32']}\n"
+                )
 
-        return _text_result(result)
+        return _text_result("".join(parts))
     except (FileNotFoundError, PermissionError, OSError) as e:
         return _text_result(f"Error scanning ROMs: {str(e)}")
     except Exception as e:
@@ -3000,11 +3062,7 @@ async def _handle_runtime_list_floppies(arguments: Any) -> list:
     async def _cb(client):
         drives = await client.list_floppies()
 
-        result = "Floppy Drives:\n\n"
-        for drive, path in sorted(drives.items()):
-            result += f"  {drive}: {path}\n"
-
-        return result
+        return _format_kv("Floppy Drives:\n\n", sorted(drives.items()))
 
     return await _ipc_call(_cb)
 
@@ -3018,9 +3076,12 @@ async def _handle_runtime_list_configs(arguments: Any) -> list:
         if not configs:
             return "No configuration files found."
 
-        result = f"Found {len(configs)} configuration file(s):\n\n"
-        for cfg in sorted(configs):
-            result += f"  - {cfg}\n"
+        result = "".join(
+            [
+                f"Found {len(configs)} configuration file(s):\n\n",
+                *(f"  - {cfg}\n" for cfg in sorted(configs)),
+            ]
+        )
 
         return result
 
@@ -3063,11 +3124,7 @@ async def _handle_runtime_get_version(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_version()
 
-        result = "Amiberry Version Info:\n\n"
-        for key, value in info.items():
-            result += f"  {key}: {value}\n"
-
-        return result
+        return _format_kv("Amiberry Version Info:\n\n", info.items())
 
     return await _ipc_call(_cb)
 
@@ -3189,11 +3246,7 @@ async def _handle_runtime_get_led_status(arguments: Any) -> list:
     async def _cb(client):
         status = await client.get_led_status()
 
-        result = "LED Status:\n\n"
-        for key, value in sorted(status.items()):
-            result += f"  {key}: {value}\n"
-
-        return result
+        return _format_kv("LED Status:\n\n", sorted(status.items()))
 
     return await _ipc_call(_cb)
 
@@ -3209,11 +3262,7 @@ async def _handle_runtime_list_harddrives(arguments: Any) -> list:
         ):
             return "No hard drives mounted."
 
-        result = "Mounted Hard Drives:\n\n"
-        for key, value in sorted(drives.items()):
-            result += f"  {key}: {value}\n"
-
-        return result
+        return _format_kv("Mounted Hard Drives:\n\n", sorted(drives.items()))
 
     return await _ipc_call(_cb)
 
@@ -3388,9 +3437,8 @@ async def _handle_runtime_get_disk_write_protect(arguments: Any) -> list:
     drive = arguments["drive"]
 
     async def _cb(client):
-        result = await client.get_disk_write_protect(drive)
-        if result:
-            is_protected, status = result
+        status = await client.get_disk_write_protect_status(drive)
+        if status is not None:
             return f"Drive DF{drive}: {status}"
         else:
             return "Failed to get write protection status."
@@ -3407,7 +3455,7 @@ async def _handle_runtime_toggle_status_line(arguments: Any) -> list:
             mode, mode_name = result
             return f"Status line: {mode_name}"
         else:
-            return "Failed to toggle status line."
+            return _STATUS_LINE_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3445,10 +3493,7 @@ async def _handle_runtime_get_memory_config(arguments: Any) -> list:
 
     async def _cb(client):
         config = await client.get_memory_config()
-        result = "Memory configuration:\n"
-        for key, value in config.items():
-            result += f"  {key}: {value}\n"
-        return result
+        return _format_kv("Memory configuration:\n", config.items())
 
     return await _ipc_call(_cb)
 
@@ -3458,10 +3503,7 @@ async def _handle_runtime_get_fps(arguments: Any) -> list:
 
     async def _cb(client):
         info = await client.get_fps()
-        result = "Performance info:\n"
-        for key, value in info.items():
-            result += f"  {key}: {value}\n"
-        return result
+        return _format_kv("Performance info:\n", info.items())
 
     return await _ipc_call(_cb)
 
@@ -3530,10 +3572,7 @@ async def _handle_runtime_get_cpu_model(arguments: Any) -> list:
 
     async def _cb(client):
         info = await client.get_cpu_model()
-        result = "CPU Model:\n"
-        for key, value in info.items():
-            result += f"  {key}: {value}\n"
-        return result
+        return _format_kv("CPU Model:\n", info.items())
 
     return await _ipc_call(_cb)
 
@@ -3581,20 +3620,20 @@ async def _handle_runtime_get_window_size(arguments: Any) -> list:
     return await _ipc_call(_cb)
 
 
+# Display mode number -> name lookups for the set_* confirmation messages
+_SCALING_NAMES = {-1: "auto", 0: "nearest", 1: "linear", 2: "integer"}
+_LINE_MODE_NAMES = {0: "single", 1: "double", 2: "scanlines"}
+_RESOLUTION_NAMES = {0: "lores", 1: "hires", 2: "superhires"}
+
+
 async def _handle_runtime_set_scaling(arguments: Any) -> list:
     """Handle runtime_set_scaling tool."""
     mode = arguments["mode"]
-    mode_names = ["auto", "nearest", "linear", "integer"]
 
     async def _cb(client):
         success = await client.set_scaling(mode)
         if success:
-            mode_index = mode + 1  # -1..2 -> 0..3
-            mode_name = (
-                mode_names[mode_index]
-                if 0 <= mode_index < len(mode_names)
-                else str(mode)
-            )
+            mode_name = _SCALING_NAMES.get(mode) or str(mode)
             return f"Scaling mode set to {mode_name}."
         else:
             return "Failed to set scaling mode."
@@ -3607,10 +3646,7 @@ async def _handle_runtime_get_scaling(arguments: Any) -> list:
 
     async def _cb(client):
         info = await client.get_scaling()
-        result = "Scaling:\n"
-        for key, value in info.items():
-            result += f"  {key}: {value}\n"
-        return result
+        return _format_kv("Scaling:\n", info.items())
 
     return await _ipc_call(_cb)
 
@@ -3618,12 +3654,11 @@ async def _handle_runtime_get_scaling(arguments: Any) -> list:
 async def _handle_runtime_set_line_mode(arguments: Any) -> list:
     """Handle runtime_set_line_mode tool."""
     mode = arguments["mode"]
-    mode_names = ["single", "double", "scanlines"]
 
     async def _cb(client):
         success = await client.set_line_mode(mode)
         if success:
-            mode_name = mode_names[mode] if 0 <= mode < len(mode_names) else str(mode)
+            mode_name = _LINE_MODE_NAMES.get(mode) or str(mode)
             return f"Line mode set to {mode_name}."
         else:
             return "Failed to set line mode."
@@ -3636,10 +3671,7 @@ async def _handle_runtime_get_line_mode(arguments: Any) -> list:
 
     async def _cb(client):
         info = await client.get_line_mode()
-        result = "Line mode:\n"
-        for key, value in info.items():
-            result += f"  {key}: {value}\n"
-        return result
+        return _format_kv("Line mode:\n", info.items())
 
     return await _ipc_call(_cb)
 
@@ -3647,12 +3679,11 @@ async def _handle_runtime_get_line_mode(arguments: Any) -> list:
 async def _handle_runtime_set_resolution(arguments: Any) -> list:
     """Handle runtime_set_resolution tool."""
     mode = arguments["mode"]
-    mode_names = ["lores", "hires", "superhires"]
 
     async def _cb(client):
         success = await client.set_resolution(mode)
         if success:
-            mode_name = mode_names[mode] if 0 <= mode < len(mode_names) else str(mode)
+            mode_name = _RESOLUTION_NAMES.get(mode) or str(mode)
             return f"Resolution set to {mode_name}."
         else:
             return "Failed to set resolution."
@@ -3685,11 +3716,8 @@ async def _handle_runtime_get_whdload(arguments: Any) -> list:
         if info:
             if info.get("loaded") == "0":
                 return "No WHDLoad game loaded."
-            result = "WHDLoad game:\n"
-            for key, value in info.items():
-                if value:  # Only show non-empty values
-                    result += f"  {key}: {value}\n"
-            return result
+            # Only show non-empty values
+            return _format_kv("WHDLoad game:\n", ((k, v) for k, v in info.items() if v))
         else:
             return "Failed to get WHDLoad info."
 
@@ -3705,10 +3733,7 @@ async def _handle_runtime_debug_status(arguments: Any) -> list:
     async def _cb(client):
         info = await client.debug_status()
         if info:
-            result = "Debugger status:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("Debugger status:\n", info.items())
         else:
             return "Failed to get debugger status."
 
@@ -3723,13 +3748,17 @@ async def _handle_runtime_get_cpu_regs(arguments: Any) -> list:
         if info:
             result = "CPU Registers:\n"
             # Format nicely: D0-D7 on one section, A0-A7 on another
-            data_regs = [f"  {k}: {v}" for k, v in info.items() if k.startswith("D")]
-            addr_regs = [f"  {k}: {v}" for k, v in info.items() if k.startswith("A")]
-            other_regs = [
-                f"  {k}: {v}"
-                for k, v in info.items()
-                if not k.startswith("D") and not k.startswith("A")
-            ]
+            data_regs: list[str] = []
+            addr_regs: list[str] = []
+            other_regs: list[str] = []
+            for k, v in info.items():
+                first = k[:1]
+                if first == "D":
+                    data_regs.append(f"  {k}: {v}")
+                elif first == "A":
+                    addr_regs.append(f"  {k}: {v}")
+                else:
+                    other_regs.append(f"  {k}: {v}")
             result += "Data registers:\n" + "\n".join(data_regs) + "\n"
             result += "Address registers:\n" + "\n".join(addr_regs) + "\n"
             result += "Other:\n" + "\n".join(other_regs)
@@ -3746,16 +3775,17 @@ async def _handle_runtime_get_custom_regs(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_custom_regs()
         if info:
-            result = "Custom Chip Registers:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("Custom Chip Registers:\n", info.items())
         else:
             return "Failed to get custom registers."
 
     return await _ipc_call(_cb)
 
 
+# Large disassemblies are split into TextContent blocks of this many lines
+_DISASSEMBLY_CHUNK_LINES = 256
+
+
 async def _handle_runtime_disassemble(arguments: Any) -> list:
     """Handle runtime_disassemble tool."""
     address = arguments["address"]
@@ -3763,13 +3793,14 @@ async def _handle_runtime_disassemble(arguments: Any) -> list:
 
     async def _cb(client):
         lines = await client.disassemble(address, count)
-        if lines:
-            result = f"Disassembly at {address}:\n"
-            for line in lines:
-                result += f"  {line}\n"
-            return result
-        else:
+        if not lines:
             return "No disassembly returned."
+        blocks = []
+        for start in range(0, len(lines), _DISASSEMBLY_CHUNK_LINES):
+            chunk = lines[start : start + _DISASSEMBLY_CHUNK_LINES]
+            header = f"Disassembly at {address}:\n" if start == 0 else ""
+            blocks.append(_tc("".join([header, *(f"  {line}\n" for line in chunk)])))
+        return blocks
 
     return await _ipc_call(_cb)
 
@@ -3782,11 +3813,11 @@ async def _handle_runtime_clear_breakpoint(arguments: Any) -> list:
         success = await client.clear_breakpoint(address)
         if success:
             if address.upper() == "ALL":
-                return "All breakpoints cleared."
+                return _ALL_BREAKPOINTS_CLEARED
             else:
                 return f"Breakpoint at {address} cleared."
         else:
-            return "Failed to clear breakpoint."
+            return _CLEAR_BREAKPOINT_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3797,12 +3828,11 @@ async def _handle_runtime_list_breakpoints(arguments: Any) -> list:
     async def _cb(client):
         breakpoints = await client.list_breakpoints()
         if breakpoints:
-            result = "Active breakpoints:\n"
-            for bp in breakpoints:
-                result += f"  {bp}\n"
-            return result
+            return "".join(
+                ["Active breakpoints:\n", *(f"  {bp}\n" for bp in breakpoints)]
+            )
         else:
-            return "No active breakpoints."
+            return _NO_BREAKPOINTS
 
     return await _ipc_call(_cb)
 
@@ -3813,12 +3843,9 @@ async def _handle_runtime_get_copper_state(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_copper_state()
         if info:
-            result = "Copper State:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("Copper State:\n", info.items())
         else:
-            return "Failed to get Copper state."
+            return _COPPER_STATE_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3829,12 +3856,9 @@ async def _handle_runtime_get_blitter_state(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_blitter_state()
         if info:
-            result = "Blitter State:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("Blitter State:\n", info.items())
         else:
-            return "Failed to get Blitter state."
+            return _BLITTER_STATE_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3846,12 +3870,12 @@ async def _handle_runtime_get_drive_state(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_drive_state(drive)
         if info:
-            result = f"Drive State{' (DF' + str(drive) + ')' if drive is not None else ''}:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv(
+                f"Drive State{' (DF' + str(drive) + ')' if drive is not None else ''}:\n",
+                info.items(),
+            )
         else:
-            return "Failed to get drive state."
+            return _DRIVE_STATE_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3862,12 +3886,9 @@ async def _handle_runtime_get_audio_state(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_audio_state()
         if info:
-            result = "Audio State:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("Audio State:\n", info.items())
         else:
-            return "Failed to get audio state."
+            return _AUDIO_STATE_FAILED
 
     return await _ipc_call(_cb)
 
@@ -3878,12 +3899,45 @@ async def _handle_runtime_get_dma_state(arguments: Any) -> list:
     async def _cb(client):
         info = await client.get_dma_state()
         if info:
-            result = "DMA State:\n"
-            for key, value in info.items():
-                result += f"  {key}: {value}\n"
-            return result
+            return _format_kv("DMA State:\n", info.items())
         else:
-            return "Failed to get DMA state."
+            return _DMA_STATE_FAILED
+
+    return await _ipc_call(_cb)
+
+
+_DUMP_STATE_SECTIONS = (
+    ("Copper State", "get_copper_state"),
+    ("Blitter State", "get_blitter_state"),
+    ("DMA State", "get_dma_state"),
+    ("Audio State", "get_audio_state"),
+    ("Drive State", "get_drive_state"),
+)
+
+
+async def _handle_runtime_dump_all_state(arguments: Any) -> list:
+    """Handle runtime_dump_all_state tool."""
+
+    async def _cb(client):
+        # Issue all queries at once; the client queues them back-to-back on
+        # its single connection instead of waiting for one tool call each.
+        results = await asyncio.gather(
+            *(getattr(client, method)() for _, method in _DUMP_STATE_SECTIONS),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        sections = []
+        for (label, _), info in zip(_DUMP_STATE_SECTIONS, results, strict=True):
+            if isinstance(info, BaseException):
+                sections.append(f"{label}:\n  Error: {info}\n")
+            elif not info:
+                sections.append(f"{label}:\n  Unavailable\n")
+            else:
+                sections.append(_format_kv(f"{label}:\n", info.items()))
+        return "\n".join(sections)
 
     return await _ipc_call(_cb)
 
@@ -3977,7 +4031,7 @@ async def _handle_restart_amiberry(arguments: Any) -> list:
     # Re-launch with stored command
     cmd = _state.launch_cmd
     try:
-        proc = launch_and_store(cmd, log_path=_state.log_path)
+        proc = await asyncio.to_thread(launch_and_store, cmd, log_path=_state.log_path)
         return _text_result(
             f"Amiberry restarted (PID: {proc.pid})\nCommand: {' '.join(cmd)}"
         )
@@ -4070,10 +4124,7 @@ async def _handle_runtime_screenshot_view(arguments: Any) -> list:
 
                 if _HAS_IMAGE_CONTENT and _ImageContent is not None:
                     return [
-                        TextContent(
-                            type="text",
-                            text=f"Screenshot saved to: {filename}",
-                        ),
+                        _tc(f"Screenshot saved to: {filename}"),
                         _ImageContent(
                             type="image",
                             data=b64_data,
@@ -4261,13 +4312,14 @@ async def _handle_get_crash_info(arguments: Any) -> list:
 
         def _find_latest_log():
             logs = []
-            for p in LOG_DIR.glob("*.log"):
+            for entry in iter_files_with_suffix(LOG_DIR, ".log"):
                 try:
-                    logs.append((p, p.stat().st_mtime))
+                    logs.append((Path(entry.path), entry.stat().st_mtime))
                 except OSError:
                     continue
-            logs.sort(key=lambda x: x[1], reverse=True)
-            return [p for p, _ in logs[:1]]
+            if not logs:
+                return []
+            return [max(logs, key=itemgetter(1))[0]]
 
         log_files_to_scan = await asyncio.to_thread(_find_latest_log)
 
@@ -4376,7 +4428,7 @@ async def _handle_launch_and_wait_for_ipc(arguments: Any) -> list:
     # Resolve config path if specified
     config_path = None
     if config:
-        config_path = _find_config_path(config)
+        config_path = await asyncio.to_thread(_find_config_path, config)
         if not config_path:
             return _text_result(f"Error: Configuration '{config}' not found")
 
@@ -4402,7 +4454,7 @@ async def _handle_launch_and_wait_for_ipc(arguments: Any) -> list:
     log_path = LOG_DIR / log_name
 
     try:
-        launch_and_store(cmd, log_path=log_path)
+        await asyncio.to_thread(launch_and_store, cmd, log_path=log_path)
     except (FileNotFoundError, PermissionError, OSError, ValueError) as e:
         _state.close_log_handle()
         return _text_result(f"Error launching Amiberry: {str(e)}")
@@ -4461,7 +4513,7 @@ async def _handle_launch_and_wait_for_ipc(arguments: Any) -> list:
 
 
 # Tool dispatch dictionary
-_TOOL_DISPATCH: dict[str, Any] = {
+_TOOL_DISPATCH: dict[str, Callable[[Any], Awaitable[list]]] = {
     "get_platform_info": _handle_get_platform_info,
     "list_configs": _handle_list_configs,
     "get_config_content": _handle_get_config_content,
@@ -4583,6 +4635,7 @@ _TOOL_DISPATCH: dict[str, Any] = {
     "runtime_get_drive_state": _handle_runtime_get_drive_state,
     "runtime_get_audio_state": _handle_runtime_get_audio_state,
     "runtime_get_dma_state": _handle_runtime_get_dma_state,
+    "runtime_dump_all_state": _handle_runtime_dump_all_state,
     "check_process_alive": _handle_check_process_alive,
     "get_process_info": _handle_get_process_info,
     "kill_amiberry": _handle_kill_amiberry,
@@ -4612,12 +4665,16 @@ async def call_tool(name: str, arguments: Any) -> list:
 
 async def main():
     """Main entry point for the MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        # Drop the persistent IPC socket cleanly on shutdown
+        await close_ipc_client()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ process gets its own module-level state instance.
 
 import asyncio
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -41,6 +42,8 @@ class ProcessState:
 # Module-level state — each importing process gets its own instance.
 _state = ProcessState()
 _state_lock = asyncio.Lock()
+# Serialises launch_and_store, which runs in worker threads via asyncio.to_thread
+_launch_lock = threading.Lock()
 
 
 def get_state() -> ProcessState:
@@ -66,11 +69,25 @@ def get_ipc_client(state: ProcessState | None = None) -> AmiberryIPCClient:
         and state.ipc_client_cache[0] == state.active_instance
     ):
         return state.ipc_client_cache[1]
-    client = AmiberryIPCClient(prefer_dbus=False, instance=state.active_instance)
+    client = AmiberryIPCClient(instance=state.active_instance)
     state.ipc_client_cache = (state.active_instance, client)
     return client
 
 
+async def close_ipc_client(state: ProcessState | None = None) -> None:
+    """Close and forget the cached IPC client, if any.
+
+    Args:
+        state: Optional explicit state; defaults to the module singleton.
+    """
+    if state is None:
+        state = _state
+    cached = state.ipc_client_cache
+    state.ipc_client_cache = None
+    if cached is not None:
+        await cached[1].close()
+
+
 def launch_and_store(
     cmd: list[str],
     log_path: Path | None = None,
@@ -79,7 +96,8 @@ def launch_and_store(
     """Launch Amiberry, store state, and return the process.
 
     Centralises the close-log -> launch -> store-state pattern used by
-    all launch handlers.
+    all launch handlers. Runs under a thread lock, so concurrent launches
+    from worker threads cannot interleave their state updates.
 
     Args:
         cmd: Command to execute.
@@ -88,11 +106,12 @@ def launch_and_store(
     """
     if state is None:
         state = _state
-    state.close_log_handle()
-    state.ipc_client_cache = None
-    proc, log_handle = launch_process(cmd, log_path=log_path)
-    state.process = proc
-    state.launch_cmd = cmd
-    state.log_path = log_path
-    state.log_file_handle = log_handle
+    with _launch_lock:
+        state.close_log_handle()
+        state.ipc_client_cache = None
+        proc, log_handle = launch_process(cmd, log_path=log_path)
+        state.process = proc
+        state.launch_cmd = cmd
+        state.log_path = log_path
+        state.log_file_handle = log_handle
     return proc
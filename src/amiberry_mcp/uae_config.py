@@ -3,9 +3,15 @@ UAE configuration file parser and generator.
 Handles reading, writing, and modifying Amiberry .uae configuration files.
 """
 
+import io
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# First characters that mark a .uae line as a comment
+_COMMENT_CHARS = frozenset(";#")
+
 
 def parse_uae_config(path: Path) -> dict[str, str]:
     """
@@ -24,22 +30,30 @@ def parse_uae_config(path: Path) -> dict[str, str]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    # Decode the whole file in one call rather than line by line. Iterating a
+    # StringIO splits on "\n" only, unlike str.splitlines(), which also breaks
+    # on form feeds and Unicode separators that may appear inside values.
+    text = path.read_bytes().decode("utf-8", errors="replace")
+    return _parse_uae_lines(io.StringIO(text))
+
+
+def _parse_uae_lines(lines: Iterable[str]) -> dict[str, str]:
+    """Parse .uae configuration lines (see parse_uae_config)."""
     config: dict[str, str] = {}
 
     line_num = 0
     try:
-        with open(path, encoding="utf-8", errors="replace") as f:
-            for line_num, line in enumerate(f, 1):  # noqa: B007
-                line = line.strip()
+        for line_num, line in enumerate(lines, 1):  # noqa: B007
+            line = line.strip()
 
-                # Skip empty lines and comments
-                if not line or line.startswith(";") or line.startswith("#"):
-                    continue
+            # Skip empty lines and comments
+            if not line or line[0] in _COMMENT_CHARS:
+                continue
 
-                # Parse key=value pairs
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    config[key.strip()] = value.strip()
+            # Parse key=value pairs
+            key, sep, value = line.partition("=")
+            if sep:
+                config[key.strip()] = value.strip()
 
     except Exception as e:
         raise ValueError(f"Error parsing config file at line {line_num}: {e}") from e
@@ -47,6 +61,21 @@ def parse_uae_config(path: Path) -> dict[str, str]:
     return config
 
 
+# Section comments used by write_uae_config, in file order
+_SECTION_NAMES = {
+    "cpu": "CPU",
+    "chipset": "Chipset",
+    "memory": "Memory",
+    "floppy": "Floppy Drives",
+    "hardfile": "Hard Drives",
+    "filesystem": "Filesystem",
+    "gfx": "Graphics",
+    "sound": "Sound",
+    "input": "Input",
+    "other": "Other Settings",
+}
+
+
 def write_uae_config(path: Path, config: dict[str, str]) -> None:
     """
     Write a configuration dictionary to a .uae file.
@@ -58,68 +87,54 @@ def write_uae_config(path: Path, config: dict[str, str]) -> None:
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Group common settings together for readability
+    groups: dict[str, list[tuple[str, str]]] = {
+        "cpu": [],
+        "chipset": [],
+        "memory": [],
+        "floppy": [],
+        "hardfile": [],
+        "filesystem": [],
+        "gfx": [],
+        "sound": [],
+        "input": [],
+        "other": [],
+    }
+
+    for key, value in sorted(config.items()):
+        key_lower = key.lower()
+        if key_lower.startswith("cpu"):
+            groups["cpu"].append((key, value))
+        elif key_lower.startswith(("chipset", "collision", "blitter")):
+            groups["chipset"].append((key, value))
+        elif key_lower.startswith(("chip_", "fast", "bogo", "z3", "mbresmem")):
+            groups["memory"].append((key, value))
+        elif key_lower.startswith(("floppy", "df", "nr_floppy")):
+            groups["floppy"].append((key, value))
+        elif key_lower.startswith("hardfile"):
+            groups["hardfile"].append((key, value))
+        elif key_lower.startswith(("filesystem", "uaehf")):
+            groups["filesystem"].append((key, value))
+        elif key_lower.startswith("gfx"):
+            groups["gfx"].append((key, value))
+        elif key_lower.startswith("sound"):
+            groups["sound"].append((key, value))
+        elif key_lower.startswith(("input", "joyport")):
+            groups["input"].append((key, value))
+        else:
+            groups["other"].append((key, value))
+
+    # Header comment, then each group with a section comment
+    parts = ["; Amiberry configuration file\n; Generated by amiberry-mcp-server\n\n"]
+    for group_key, items in groups.items():
+        if items:
+            parts.append(f"; {_SECTION_NAMES[group_key]}\n")
+            parts.extend(f"{key}={value}\n" for key, value in items)
+            parts.append("\n")
+
+    # Write the whole file in one call
     with open(path, "w", encoding="utf-8") as f:
-        # Write header comment
-        f.write("; Amiberry configuration file\n")
-        f.write("; Generated by amiberry-mcp-server\n\n")
-
-        # Group common settings together for readability
-        groups = {
-            "cpu": [],
-            "chipset": [],
-            "memory": [],
-            "floppy": [],
-            "hardfile": [],
-            "filesystem": [],
-            "gfx": [],
-            "sound": [],
-            "input": [],
-            "other": [],
-        }
-
-        for key, value in sorted(config.items()):
-            key_lower = key.lower()
-            if key_lower.startswith("cpu"):
-                groups["cpu"].append((key, value))
-            elif key_lower.startswith(("chipset", "collision", "blitter")):
-                groups["chipset"].append((key, value))
-            elif key_lower.startswith(("chip_", "fast", "bogo", "z3", "mbresmem")):
-                groups["memory"].append((key, value))
-            elif key_lower.startswith(("floppy", "df", "nr_floppy")):
-                groups["floppy"].append((key, value))
-            elif key_lower.startswith("hardfile"):
-                groups["hardfile"].append((key, value))
-            elif key_lower.startswith(("filesystem", "uaehf")):
-                groups["filesystem"].append((key, value))
-            elif key_lower.startswith("gfx"):
-                groups["gfx"].append((key, value))
-            elif key_lower.startswith("sound"):
-                groups["sound"].append((key, value))
-            elif key_lower.startswith(("input", "joyport")):
-                groups["input"].append((key, value))
-            else:
-                groups["other"].append((key, value))
-
-        # Write groups with section comments
-        section_names = {
-            "cpu": "CPU",
-            "chipset": "Chipset",
-            "memory": "Memory",
-            "floppy": "Floppy Drives",
-            "hardfile": "Hard Drives",
-            "filesystem": "Filesystem",
-            "gfx": "Graphics",
-            "sound": "Sound",
-            "input": "Input",
-            "other": "Other Settings",
-        }
-
-        for group_key, items in groups.items():
-            if items:
-                f.write(f"; {section_names[group_key]}\n")
-                for key, value in items:
-                    f.write(f"{key}={value}\n")
-                f.write("\n")
+        f.write("".join(parts))
 
 
 def modify_uae_config(
@@ -145,47 +160,50 @@ def modify_uae_config(
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    original = path.read_bytes().decode("utf-8", errors="replace")
+    if not modifications:
+        return _parse_uae_lines(io.StringIO(original))
+
     # Track which modifications have been applied
     remaining = dict(modifications)
     new_lines: list[str] = []
 
-    with open(path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            stripped = line.rstrip("\n\r")
-            bare = stripped.strip()
-
-            # Preserve blank lines, comments, and non key=value lines
-            if (
-                not bare
-                or bare.startswith(";")
-                or bare.startswith("#")
-                or "=" not in bare
-            ):
-                new_lines.append(stripped)
-                continue
+    # Split on "\n" only, as parse_uae_config does; values may hold form feeds
+    for line in io.StringIO(original):
+        line = line.rstrip("\r\n")
+        bare = line.strip()
+
+        # Preserve blank lines, comments, and non key=value lines
+        if not bare or bare[0] in _COMMENT_CHARS or "=" not in bare:
+            new_lines.append(line)
+            continue
 
-            key, _, _ = bare.partition("=")
-            key = key.strip()
+        key, _, _ = bare.partition("=")
+        key = key.strip()
 
-            if key in remaining:
-                value = remaining.pop(key)
-                if value is None:
-                    # Remove this line entirely
-                    continue
-                else:
-                    new_lines.append(f"{key}={value}")
+        if key in remaining:
+            value = remaining.pop(key)
+            if value is None:
+                # Remove this line entirely
+                continue
             else:
-                new_lines.append(stripped)
+                new_lines.append(f"{key}={value}")
+        else:
+            new_lines.append(line)
 
     # Append any brand-new keys that weren't in the original file
     for key, value in remaining.items():
         if value is not None:
             new_lines.append(f"{key}={value}")
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(new_lines) + "\n")
+    content = "\n".join(new_lines) + "\n"
+    # Leave the file untouched when every option already had its target value
+    if content != original:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
 
-    return parse_uae_config(path)
+    # Parse what was written rather than reading the file back
+    return _parse_uae_lines(io.StringIO(content))
 
 
 def create_config_from_template(
@@ -204,22 +222,12 @@ def create_config_from_template(
     Returns:
         The generated configuration dictionary
     """
-    templates = {
-        "A500": _get_a500_template(),
-        "A500P": _get_a500plus_template(),
-        "A600": _get_a600_template(),
-        "A1200": _get_a1200_template(),
-        "A4000": _get_a4000_template(),
-        "CD32": _get_cd32_template(),
-        "CDTV": _get_cdtv_template(),
-    }
-
-    if template not in templates:
+    if template not in _TEMPLATES:
         raise ValueError(
-            f"Unknown template: {template}. Available: {list(templates.keys())}"
+            f"Unknown template: {template}. Available: {list(_TEMPLATES.keys())}"
         )
 
-    config = templates[template].copy()
+    config = dict(_TEMPLATE_ITEMS[template])
 
     if overrides:
         config.update(overrides)
@@ -228,6 +236,38 @@ def create_config_from_template(
     return config
 
 
+# get_config_summary memory fields:
+# (config key, summary key, default size, KB per unit of the size)
+_MEM_FIELDS = (
+    ("chipmem_size", "chip_kb", 1, 512),  # 512KB blocks
+    ("fastmem_size", "fast_kb", 0, 1),  # Already in KB
+)
+# (config key, drive name) for DF0-DF3
+_FLOPPY_KEYS = tuple((f"floppy{i}", f"DF{i}") for i in range(4))
+# (config key, legacy uaehf key) for each hard drive slot
+_HARDFILE_KEYS = tuple((f"hardfile2_{i}", f"uaehf{i}") for i in range(11))
+
+
+def _memory_kb(config: dict[str, str], key: str, default: int, unit_kb: int) -> int:
+    """Return a memory size in KB, falling back to the default if invalid."""
+    try:
+        return int(config.get(key, default)) * unit_kb
+    except (ValueError, TypeError):
+        return default * unit_kb
+
+
+def _iter_floppies(config: dict[str, str]) -> Iterator[dict[str, str]]:
+    """Yield the drive and image of each floppy drive with a disk inserted.
+
+    Empty drives are skipped rather than ending the scan, since DF1 can hold
+    a disk while DF0 is empty.
+    """
+    for key, drive in _FLOPPY_KEYS:
+        floppy = config.get(key)
+        if floppy:
+            yield {"drive": drive, "image": floppy}
+
+
 def get_config_summary(config: dict[str, str]) -> dict[str, Any]:
     """
     Generate a human-readable summary of a configuration.
@@ -252,17 +292,9 @@ def get_config_summary(config: dict[str, str]) -> dict[str, Any]:
     }
 
     # Memory
-    try:
-        chip_size = int(config.get("chipmem_size", "1")) * 512  # In KB
-    except (ValueError, TypeError):
-        chip_size = 512
-    try:
-        fast_size = int(config.get("fastmem_size", "0"))  # Already in KB
-    except (ValueError, TypeError):
-        fast_size = 0
     summary["memory"] = {
-        "chip_kb": chip_size,
-        "fast_kb": fast_size,
+        summary_key: _memory_kb(config, key, default, unit_kb)
+        for key, summary_key, default, unit_kb in _MEM_FIELDS
     }
 
     # Chipset
@@ -270,17 +302,12 @@ def get_config_summary(config: dict[str, str]) -> dict[str, Any]:
     summary["chipset"] = chipset.upper()
 
     # Floppy drives
-    floppies = []
-    for i in range(4):
-        floppy = config.get(f"floppy{i}")
-        if floppy:
-            floppies.append({"drive": f"DF{i}", "image": floppy})
-    summary["floppies"] = floppies
+    summary["floppies"] = list(_iter_floppies(config))
 
     # Hard drives
     hardfiles = []
-    for idx in range(11):
-        hf = config.get(f"hardfile2_{idx}") or config.get(f"uaehf{idx}")
+    for key, alt_key in _HARDFILE_KEYS:
+        hf = config.get(key) or config.get(alt_key)
         if hf:
             hardfiles.append(hf)
     summary["hardfiles"] = hardfiles
@@ -475,3 +502,23 @@ def _get_cdtv_template() -> dict[str, str]:
         "sound_channels": "stereo",
         "sound_frequency": "44100",
     }
+
+
+# Built-in templates by name, in the order listed to users. Read-only, so no
+# caller can alter a template for everyone else.
+_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        name: MappingProxyType(build())
+        for name, build in (
+            ("A500", _get_a500_template),
+            ("A500P", _get_a500plus_template),
+            ("A600", _get_a600_template),
+            ("A1200", _get_a1200_template),
+            ("A4000", _get_a4000_template),
+            ("CD32", _get_cd32_template),
+            ("CDTV", _get_cdtv_template),
+        )
+    }
+)
+# Template items ready to seed a new config dict
+_TEMPLATE_ITEMS = {name: tuple(t.items()) for name, t in _TEMPLATES.items()}
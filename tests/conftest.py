@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures.
+"""
+
+import copy
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from amiberry_mcp.uae_config import create_config_from_template
+
+# tmpfs mount used for test temp directories on Linux, when available
+_SHM_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config):
+    """Put tmp_path directories on tmpfs so file tests are not sync-bound.
+
+    Sets a per-run base temp directory, removed when the run ends. An explicit
+    --basetemp (which xdist also passes to its workers) or PYTEST_DEBUG_TEMPROOT
+    still takes precedence.
+    """
+    if config.option.basetemp or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if _SHM_ROOT.is_dir() and os.access(_SHM_ROOT, os.W_OK | os.X_OK):
+        basetemp = tempfile.mkdtemp(prefix="pytest-", dir=_SHM_ROOT)
+        config.option.basetemp = basetemp
+        config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
+
+# Canonical ROM-sized blobs: file name -> (fill byte, size)
+_ROM_BLOBS = {
+    "256k_X": (b"X", 262144),
+    "512k_Y": (b"Y", 524288),
+    "1m_Z": (b"Z", 1048576),
+}
+
+
+@pytest.fixture(scope="session")
+def rom_blobs(tmp_path_factory) -> Path:
+    """Directory holding ROM-sized blobs, written once per test session."""
+    root = tmp_path_factory.mktemp("blobs")
+    for name, (fill, size) in _ROM_BLOBS.items():
+        (root / name).write_bytes(fill * size)
+    return root
+
+
+@pytest.fixture
+def stage_rom(rom_blobs) -> Callable[[str, Path], Path]:
+    """Return a helper that places a shared ROM blob at a test path.
+
+    The blob is hardlinked rather than copied, so every test hashes the same
+    inode. Tests must not modify staged files in place.
+    """
+
+    def stage(blob: str, dst: Path) -> Path:
+        src = rom_blobs / blob
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Filesystems without hardlink support
+            shutil.copyfile(src, dst)
+        return dst
+
+    return stage
+
+
+# Templates whose generated configs are shared through parsed_templates
+_SHARED_TEMPLATES = ("A500", "A1200", "CD32")
+
+
+@pytest.fixture(scope="session")
+def _template_configs(tmp_path_factory) -> dict[str, dict[str, str]]:
+    """Generate each shared template once per test session."""
+    out_dir = tmp_path_factory.mktemp("tpl")
+    return {
+        model: create_config_from_template(out_dir / f"{model}.uae", model)
+        for model in _SHARED_TEMPLATES
+    }
+
+
+@pytest.fixture
+def parsed_templates(_template_configs) -> dict[str, dict[str, str]]:
+    """Template configs keyed by model; each test gets its own copy."""
+    return copy.deepcopy(_template_configs)
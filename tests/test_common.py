@@ -5,14 +5,31 @@ Unit tests for the common module.
 Covers:
 - Fix #6: terminate_process handles ProcessLookupError
 - Fix #18: classify_image_type handles unknown extensions
+- scan_disk_images single-pass directory walk
+- list_config_files directory-mtime cache
+- format_log_timestamp output format
+- iter_files_with_suffix scandir walk
+- read_config_text stat-keyed read cache
 """
 
+import datetime
+import os
 import subprocess
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from amiberry_mcp.common import classify_image_type, terminate_process
+from amiberry_mcp.common import (
+    classify_image_type,
+    clear_scan_cache,
+    format_log_timestamp,
+    iter_files_with_suffix,
+    list_config_files,
+    read_config_text,
+    scan_disk_images,
+    terminate_process,
+)
 
 
 class TestTerminateProcess:
@@ -120,5 +137,189 @@ class TestClassifyImageType:
         assert classify_image_type(".ISO") == "cd"
 
 
+class TestScanDiskImages:
+    """Tests for the single-pass scan_disk_images walk."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_scan_cache()
+        yield
+        clear_scan_cache()
+
+    def test_finds_nested_images_case_insensitively(self, tmp_path):
+        """Images in subdirectories and with uppercase extensions are found."""
+        (tmp_path / "games").mkdir()
+        (tmp_path / "games" / "Turrican.ADF").write_bytes(b"x")
+        (tmp_path / "work.hdf").write_bytes(b"xy")
+        (tmp_path / "readme.txt").write_bytes(b"z")
+
+        images = scan_disk_images([tmp_path])
+
+        assert [img["name"] for img in images] == ["Turrican.ADF", "work.hdf"]
+        assert images[0]["type"] == "floppy"
+        assert images[1]["type"] == "hardfile"
+        assert images[1]["size"] == 2
+
+    def test_type_and_search_filters(self, tmp_path):
+        """Type and search term filters should both apply."""
+        (tmp_path / "Lemmings.adf").write_bytes(b"x")
+        (tmp_path / "Lotus.adf").write_bytes(b"x")
+        (tmp_path / "Lemmings.lha").write_bytes(b"x")
+
+        images = scan_disk_images([tmp_path], image_type="floppy", search_term="lem")
+
+        assert [img["name"] for img in images] == ["Lemmings.adf"]
+
+    def test_searches_share_cached_walk(self, tmp_path):
+        """Different search terms filter one cached walk, case-insensitively."""
+        (tmp_path / "Lemmings.adf").write_bytes(b"x")
+        (tmp_path / "Lotus.adf").write_bytes(b"x")
+
+        images = scan_disk_images([tmp_path], search_term="LEM")
+        assert [img["name"] for img in images] == ["Lemmings.adf"]
+
+        (tmp_path / "Lotus2.adf").write_bytes(b"x")
+        images = scan_disk_images([tmp_path], search_term="lotus")
+
+        assert [img["name"] for img in images] == ["Lotus.adf"]
+
+    def test_overlapping_dirs_not_duplicated(self, tmp_path):
+        """A file reachable from two search roots is listed once."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "disk.adf").write_bytes(b"x")
+
+        images = scan_disk_images([tmp_path, tmp_path])
+
+        assert len(images) == 1
+
+    def test_missing_directory_is_skipped(self, tmp_path):
+        """Nonexistent search directories should not raise."""
+        assert scan_disk_images([tmp_path / "missing"]) == []
+
+
+class TestListConfigFiles:
+    """Tests for the mtime-validated list_config_files cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_scan_cache()
+        yield
+        clear_scan_cache()
+
+    def test_lists_only_uae_files(self, tmp_path):
+        """Only .uae files should be returned."""
+        (tmp_path / "a500.uae").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        assert [f.name for f in list_config_files(tmp_path)] == ["a500.uae"]
+
+    def test_cached_until_directory_changes(self, tmp_path):
+        """A settled directory listing is reused until its mtime changes."""
+        (tmp_path / "a500.uae").write_text("")
+        os.utime(tmp_path, (1_000_000, 1_000_000))
+
+        first = list_config_files(tmp_path)
+        assert list_config_files(tmp_path) is first
+
+        (tmp_path / "a1200.uae").write_text("")
+        names = sorted(f.name for f in list_config_files(tmp_path))
+        assert names == ["a1200.uae", "a500.uae"]
+
+    def test_missing_directory_returns_empty(self, tmp_path):
+        """A nonexistent directory should yield no configs."""
+        assert list_config_files(tmp_path / "missing") == []
+
+
+class TestFormatLogTimestamp:
+    """Tests for format_log_timestamp."""
+
+    def test_local_time_to_the_second(self):
+        """Timestamps are local time without fractional seconds."""
+        mtime = 1_700_000_000.75
+        expected = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+
+        assert format_log_timestamp(mtime) == expected
+
+
+class TestIterFilesWithSuffix:
+    """Tests for the scandir-based iter_files_with_suffix walker."""
+
+    def test_top_level_only_by_default(self, tmp_path):
+        """Without recursion only direct children are yielded."""
+        (tmp_path / "a.uss").write_text("")
+        (tmp_path / "b.txt").write_text("")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.uss").write_text("")
+
+        names = [e.name for e in iter_files_with_suffix(tmp_path, ".uss")]
+
+        assert names == ["a.uss"]
+
+    def test_recursive_walk_skips_directories(self, tmp_path):
+        """Recursion finds nested files; directories never match."""
+        (tmp_path / "a.uss").write_text("")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.uss").write_text("")
+        (tmp_path / "dir.uss").mkdir()
+
+        names = sorted(
+            e.name for e in iter_files_with_suffix(tmp_path, ".uss", recursive=True)
+        )
+
+        assert names == ["a.uss", "c.uss"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """A nonexistent root is treated as empty."""
+        assert list(iter_files_with_suffix(tmp_path / "missing", ".uss")) == []
+
+    def test_ignore_case_matches_uppercase_names(self, tmp_path):
+        """ignore_case lowercases names before matching lowercase suffixes."""
+        (tmp_path / "a.ROM").write_text("")
+        (tmp_path / "b.rom").write_text("")
+
+        exact = [e.name for e in iter_files_with_suffix(tmp_path, ".rom")]
+        folded = sorted(
+            e.name for e in iter_files_with_suffix(tmp_path, ".rom", ignore_case=True)
+        )
+
+        assert exact == ["b.rom"]
+        assert folded == ["a.ROM", "b.rom"]
+
+
+class TestReadConfigText:
+    """Tests for the stat-keyed read_config_text cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_scan_cache()
+        yield
+        clear_scan_cache()
+
+    def test_unchanged_file_read_once(self, tmp_path):
+        """A settled, unchanged config is served from the cache."""
+        config = tmp_path / "a500.uae"
+        config.write_text("cpu_model=68000\n")
+        os.utime(config, (1_000_000, 1_000_000))
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as read_text:
+            assert read_config_text(config) == "cpu_model=68000\n"
+            assert read_config_text(config) == "cpu_model=68000\n"
+
+        assert read_text.call_count == 1
+
+    def test_modified_file_reread(self, tmp_path):
+        """Rewriting a config changes its stat key and forces a fresh read."""
+        config = tmp_path / "a500.uae"
+        config.write_text("cpu_model=68000\n")
+        os.utime(config, (1_000_000, 1_000_000))
+        read_config_text(config)
+
+        config.write_text("cpu_model=68020\n")
+
+        assert read_config_text(config) == "cpu_model=68020\n"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
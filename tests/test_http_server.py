@@ -6,10 +6,11 @@ Covers:
 - Fix #2: CORS restricted to localhost, bind to 127.0.0.1
 - Fix #3: Path traversal prevention on HTTP endpoints
 - Fix #10: Specific pgrep pattern, tracked process preferred
+- Malformed breakpoint addresses rejected with 400
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -128,3 +129,41 @@ class TestPgrepPattern:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestBreakpointEndpoints:
+    """Malformed breakpoint addresses are client errors, not server errors."""
+
+    @pytest.fixture
+    def http_client(self):
+        from fastapi.testclient import TestClient
+
+        from amiberry_mcp import http_server
+        from amiberry_mcp.ipc_client import AmiberryIPCClient
+
+        ipc = AmiberryIPCClient(instance=0)
+        with (
+            patch.object(http_server, "get_ipc_client", return_value=ipc),
+            patch.object(ipc, "_send_command", AsyncMock()) as send,
+        ):
+            yield TestClient(http_server.app), send
+
+    def test_set_malformed_address_is_400(self, http_client):
+        client, send = http_client
+
+        response = client.post("/runtime/breakpoints", json={"address": "0xZZ"})
+
+        assert response.status_code == 400
+        assert "Invalid address" in response.json()["detail"]
+        send.assert_not_awaited()
+
+    def test_clear_malformed_address_is_400(self, http_client):
+        client, send = http_client
+
+        response = client.request(
+            "DELETE", "/runtime/breakpoints", json={"address": "FC0000"}
+        )
+
+        assert response.status_code == 400
+        assert "Invalid address" in response.json()["detail"]
+        send.assert_not_awaited()
@@ -6,8 +6,11 @@ Covers:
 - Fix #1: IPC protocol injection prevention (tab/newline sanitization)
 - Fix #12: Response readline max length cap
 - Fix #14: Response rstrip instead of strip
+- key=value response parsing
+- Breakpoint address validation
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -179,6 +182,23 @@ class TestResponseParsing:
             assert success is True
             assert data == ["value"]
 
+    def test_kv_response_parsing(self):
+        """key=value items are split once; bools are coerced case-insensitively."""
+        from amiberry_mcp.ipc_client import _parse_kv_response
+
+        data = ["paused=TRUE", "warp=false", "expr=a=b", "noise"]
+
+        assert _parse_kv_response(data) == {
+            "paused": "TRUE",
+            "warp": "false",
+            "expr": "a=b",
+        }
+        assert _parse_kv_response(data, coerce_bools=True) == {
+            "paused": True,
+            "warp": False,
+            "expr": "a=b",
+        }
+
 
 class TestResponseSizeLimit:
     """Tests for Fix #12: Response readline max length."""
@@ -233,5 +253,157 @@ class TestResponseSizeLimit:
             assert data == ["normal response"]
 
 
+class TestConnectionReuse:
+    """Tests for the persistent socket connection fast path."""
+
+    @pytest.mark.asyncio
+    async def test_live_connection_skips_socket_stat(self):
+        """Only the first command should stat the socket path."""
+        client = AmiberryIPCClient(instance=0)
+        with (
+            patch("asyncio.open_unix_connection") as mock_conn,
+            patch("os.path.exists", return_value=True) as mock_exists,
+        ):
+            mock_reader = AsyncMock()
+            mock_reader.readline = AsyncMock(return_value=b"OK\n")
+            mock_writer = MagicMock()
+            mock_writer.is_closing = MagicMock(return_value=False)
+            mock_writer.drain = AsyncMock()
+            mock_conn.return_value = (mock_reader, mock_writer)
+
+            await client._send_socket_command("PING")
+            await client._send_socket_command("PING")
+
+            assert mock_exists.call_count == 1
+            assert mock_conn.call_count == 1
+
+
+class TestQueryCache:
+    """Tests for the short-lived cache on rarely-changing queries."""
+
+    @pytest.fixture
+    def client(self):
+        return AmiberryIPCClient(instance=0)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_uses_cache(self, client):
+        """A second call within the TTL should not hit IPC again."""
+        send = AsyncMock(return_value=(True, ["model=68020", "name=68020"]))
+        with patch.object(client, "_send_command", send):
+            first = await client.get_cpu_model()
+            second = await client.get_cpu_model()
+
+        assert first == second == {"model": "68020", "name": "68020"}
+        assert send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_setter_invalidates_cache(self, client):
+        """Setting the CPU model should force the next query to IPC."""
+        send = AsyncMock(return_value=(True, ["model=68000"]))
+        with patch.object(client, "_send_command", send):
+            await client.get_cpu_model()
+            await client.set_cpu_model(68030)
+            await client.get_cpu_model()
+
+        assert send.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_query_not_cached(self, client):
+        """None results should be retried on the next call."""
+        send = AsyncMock(return_value=(False, []))
+        with patch.object(client, "_send_command", send):
+            assert await client.get_chipset() is None
+            assert await client.get_chipset() is None
+
+        assert send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_query_not_cached(self, client):
+        """An empty dict from a failed parse should be retried."""
+        send = AsyncMock(return_value=(True, []))
+        with patch.object(client, "_send_command", send):
+            assert await client.get_cpu_model() == {}
+            assert await client.get_cpu_model() == {}
+
+        assert send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_dict_is_not_shared(self, client):
+        """Mutating a returned dict does not change later cache hits."""
+        send = AsyncMock(return_value=(True, ["model=68020"]))
+        with patch.object(client, "_send_command", send):
+            (await client.get_cpu_model())["model"] = "changed"
+            (await client.get_cpu_model())["model"] = "changed"
+            result = await client.get_cpu_model()
+
+        assert result == {"model": "68020"}
+        assert send.await_count == 1
+
+
+class TestQueryCoalescing:
+    """Tests for sharing in-flight read-only state queries."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_state_queries_share_round_trip(self):
+        """Concurrent identical state queries should send one command."""
+        client = AmiberryIPCClient(instance=0)
+        release = asyncio.Event()
+
+        async def slow_send(command, *args):
+            await release.wait()
+            return True, ["COP1LC=00000000"]
+
+        send = AsyncMock(side_effect=slow_send)
+        with patch.object(client, "_send_command", send):
+            pending = [
+                asyncio.ensure_future(client.get_copper_state()) for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+
+        assert send.await_count == 1
+        assert all(r == {"COP1LC": "00000000"} for r in results)
+        assert not client._inflight
+
+
+class TestBreakpointAddress:
+    """Tests for local validation of breakpoint addresses."""
+
+    @pytest.fixture
+    def client(self):
+        return AmiberryIPCClient(instance=0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("address", ["0xFC0000", " 0x400 ", "1024"])
+    async def test_valid_address_sent(self, client, address):
+        """Hex and decimal addresses are forwarded, trimmed of whitespace."""
+        send = AsyncMock(return_value=(True, []))
+        with patch.object(client, "_send_command", send):
+            assert await client.set_breakpoint(address) is True
+
+        send.assert_awaited_once_with("SET_BREAKPOINT", address.strip())
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("address", ["0xZZ", "FC0000", "0x123456789", ""])
+    async def test_malformed_address_rejected_without_ipc(self, client, address):
+        """Malformed addresses raise ValueError before any IPC round-trip."""
+        send = AsyncMock(return_value=(True, []))
+        with patch.object(client, "_send_command", send):
+            with pytest.raises(ValueError, match="Invalid address"):
+                await client.clear_breakpoint(address)
+
+        send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_clear_all(self, client):
+        """ALL is accepted case-insensitively when clearing."""
+        send = AsyncMock(return_value=(True, []))
+        with patch.object(client, "_send_command", send):
+            await client.clear_breakpoint("all")
+
+        send.assert_awaited_once_with("CLEAR_BREAKPOINT", "ALL")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,13 +3,17 @@
 Unit tests for the rom_manager module.
 """
 
+import hashlib
+import os
 import zlib
+from unittest.mock import patch
 
 import pytest
 
 from amiberry_mcp.rom_manager import (
     KNOWN_ROMS,
     ROM_EXTENSIONS,
+    build_rom_index,
     calculate_rom_crc32,
     calculate_rom_md5,
     find_rom_for_model,
@@ -45,6 +49,13 @@ class TestChecksumFunctions:
         assert crc == crc.upper()
         assert len(crc) == 8
 
+    def test_calculate_crc32_empty_file(self, tmp_path):
+        """An empty file has the CRC32 of no data."""
+        test_file = tmp_path / "empty.rom"
+        test_file.write_bytes(b"")
+
+        assert calculate_rom_crc32(test_file) == "00000000"
+
     def test_calculate_md5(self, tmp_path):
         """Test MD5 calculation."""
         test_file = tmp_path / "test.rom"
@@ -56,6 +67,7 @@ class TestChecksumFunctions:
         # MD5 should be 32 hex characters
         assert len(md5) == 32
         assert all(c in "0123456789abcdef" for c in md5)
+        assert md5 == hashlib.md5(test_content).hexdigest()
 
     def test_calculate_md5_lowercase(self, tmp_path):
         """Test that MD5 is lowercase hex."""
@@ -70,10 +82,9 @@ class TestChecksumFunctions:
 class TestIdentifyRom:
     """Tests for the identify_rom function."""
 
-    def test_identify_unknown_rom(self, tmp_path):
+    def test_identify_unknown_rom(self, tmp_path, stage_rom):
         """Test identifying an unknown ROM."""
-        test_file = tmp_path / "unknown.rom"
-        test_file.write_bytes(b"X" * 262144)  # 256KB
+        test_file = stage_rom("256k_X", tmp_path / "unknown.rom")
 
         result = identify_rom(test_file)
 
@@ -84,10 +95,9 @@ class TestIdentifyRom:
         assert "md5" in result
         assert result["probable_type"] == "Kickstart 1.x (256KB)"
 
-    def test_identify_512kb_rom(self, tmp_path):
+    def test_identify_512kb_rom(self, tmp_path, stage_rom):
         """Test identifying a 512KB ROM size."""
-        test_file = tmp_path / "kick31.rom"
-        test_file.write_bytes(b"Y" * 524288)  # 512KB
+        test_file = stage_rom("512k_Y", tmp_path / "kick31.rom")
 
         result = identify_rom(test_file)
 
@@ -95,16 +105,17 @@ class TestIdentifyRom:
         assert not result["identified"]
         assert result["probable_type"] == "Kickstart 2.x/3.x (512KB)"
 
-    def test_identify_1mb_rom(self, tmp_path):
+    def test_identify_1mb_rom(self, tmp_path, stage_rom):
         """Test identifying a 1MB ROM size."""
-        test_file = tmp_path / "extended.rom"
-        test_file.write_bytes(b"Z" * 1048576)  # 1MB
+        test_file = stage_rom("1m_Z", tmp_path / "extended.rom")
 
         result = identify_rom(test_file)
 
         assert result["size"] == 1048576
         assert not result["identified"]
         assert result["probable_type"] == "Extended ROM or combined ROM (1MB)"
+        # No known ROM is 1MB, so the MD5 pass is skipped
+        assert result["md5"] is None
 
     def test_identify_unknown_size(self, tmp_path):
         """Test identifying a ROM with unusual size."""
@@ -114,6 +125,52 @@ class TestIdentifyRom:
         result = identify_rom(test_file)
 
         assert result["probable_type"] == "Unknown"
+        assert result["md5"] is None
+
+    def test_identify_digests_match_standalone_helpers(self, tmp_path):
+        """The single-pass digests agree with the standalone checksum helpers."""
+        test_file = tmp_path / "kick.rom"
+        test_file.write_bytes(bytes(range(256)) * 1024)
+
+        result = identify_rom(test_file)
+
+        assert result["size"] == 262144
+        assert result["crc32"] == calculate_rom_crc32(test_file)
+        assert result["md5"] == calculate_rom_md5(test_file)
+
+    def test_identify_caches_unchanged_file(self, tmp_path):
+        """A settled, unchanged ROM is hashed once unless forced."""
+        from amiberry_mcp import rom_manager
+
+        test_file = tmp_path / "kick.rom"
+        test_file.write_bytes(b"K" * 262144)
+        os.utime(test_file, (1_000_000, 1_000_000))
+        rom_manager.clear_rom_cache()
+
+        with patch.object(
+            rom_manager, "_rom_digests", wraps=rom_manager._rom_digests
+        ) as digests:
+            first = identify_rom(test_file)
+            first["filename"] = "mutated"
+            second = identify_rom(test_file)
+            identify_rom(test_file, force=True)
+
+        assert digests.call_count == 2
+        assert second["filename"] == "kick.rom"
+        rom_manager.clear_rom_cache()
+
+    def test_identify_requires_matching_size(self, tmp_path):
+        """A known CRC32 on a file of the wrong size is not identified."""
+        test_file = tmp_path / "odd.rom"
+        data = b"Z" * 1000
+        test_file.write_bytes(data)
+        crc = f"{zlib.crc32(data) & 0xFFFFFFFF:08X}"
+        info = {"version": "9.9", "revision": "1", "model": "Test", "size": 524288}
+
+        with patch.dict(KNOWN_ROMS, {crc: info}):
+            result = identify_rom(test_file, force=True)
+
+        assert result["identified"] is False
 
     def test_identify_nonexistent_rom(self, tmp_path):
         """Test identifying a ROM that doesn't exist."""
@@ -137,11 +194,11 @@ class TestScanRomDirectory:
         result = scan_rom_directory(nonexistent)
         assert result == []
 
-    def test_scan_with_rom_files(self, tmp_path):
+    def test_scan_with_rom_files(self, tmp_path, stage_rom):
         """Test scanning a directory with ROM files."""
         # Create some test ROM files
-        (tmp_path / "kick13.rom").write_bytes(b"A" * 262144)
-        (tmp_path / "kick31.rom").write_bytes(b"B" * 524288)
+        stage_rom("256k_X", tmp_path / "kick13.rom")
+        stage_rom("512k_Y", tmp_path / "kick31.rom")
         (tmp_path / "notrom.txt").write_bytes(b"text file")
 
         result = scan_rom_directory(tmp_path)
@@ -151,13 +208,13 @@ class TestScanRomDirectory:
         assert "kick31.rom" in filenames
         assert "notrom.txt" not in filenames
 
-    def test_scan_recursive(self, tmp_path):
+    def test_scan_recursive(self, tmp_path, stage_rom):
         """Test recursive scanning."""
         # Create nested structure
         subdir = tmp_path / "subdir"
         subdir.mkdir()
-        (tmp_path / "top.rom").write_bytes(b"X" * 262144)
-        (subdir / "nested.rom").write_bytes(b"Y" * 262144)
+        stage_rom("256k_X", tmp_path / "top.rom")
+        stage_rom("256k_X", subdir / "nested.rom")
 
         result = scan_rom_directory(tmp_path, recursive=True)
 
@@ -165,12 +222,12 @@ class TestScanRomDirectory:
         assert "top.rom" in filenames
         assert "nested.rom" in filenames
 
-    def test_scan_non_recursive(self, tmp_path):
+    def test_scan_non_recursive(self, tmp_path, stage_rom):
         """Test non-recursive scanning."""
         subdir = tmp_path / "subdir"
         subdir.mkdir()
-        (tmp_path / "top.rom").write_bytes(b"X" * 262144)
-        (subdir / "nested.rom").write_bytes(b"Y" * 262144)
+        stage_rom("256k_X", tmp_path / "top.rom")
+        stage_rom("256k_X", subdir / "nested.rom")
 
         result = scan_rom_directory(tmp_path, recursive=False)
 
@@ -178,11 +235,10 @@ class TestScanRomDirectory:
         assert "top.rom" in filenames
         assert "nested.rom" not in filenames
 
-    def test_scan_multiple_extensions(self, tmp_path):
+    def test_scan_multiple_extensions(self, tmp_path, stage_rom):
         """Test scanning finds multiple extensions."""
-        (tmp_path / "kick.rom").write_bytes(b"A" * 262144)
-        (tmp_path / "kick.bin").write_bytes(b"B" * 262144)
-        (tmp_path / "kick.a500").write_bytes(b"C" * 262144)
+        for name in ("kick.rom", "kick.bin", "kick.a500"):
+            stage_rom("256k_X", tmp_path / name)
 
         result = scan_rom_directory(tmp_path)
 
@@ -191,6 +247,33 @@ class TestScanRomDirectory:
         assert "kick.bin" in filenames
         assert "kick.a500" in filenames
 
+    def test_scan_skips_matching_directories(self, tmp_path):
+        """Extensions match case-insensitively and directories are not ROMs."""
+        (tmp_path / "KICK.ROM").write_bytes(b"A" * 1024)
+        (tmp_path / "folder.rom").mkdir()
+
+        result = scan_rom_directory(tmp_path, recursive=False)
+
+        assert [r["filename"] for r in result] == ["KICK.ROM"]
+
+    def test_scan_reports_errors_per_file(self, tmp_path):
+        """A failing file yields an error entry without affecting the others."""
+        from amiberry_mcp.rom_manager import _MAX_ROM_SIZE
+
+        for i in range(4):
+            (tmp_path / f"kick{i}.rom").write_bytes(bytes([i]) * 1024)
+        with open(tmp_path / "huge.rom", "wb") as f:
+            f.seek(_MAX_ROM_SIZE + 1)
+            f.write(b"\0")
+
+        result = {r["filename"]: r for r in scan_rom_directory(tmp_path)}
+
+        assert len(result) == 5
+        assert "too large" in result["huge.rom"]["error"]
+        assert result["kick2.rom"]["crc32"] == calculate_rom_crc32(
+            tmp_path / "kick2.rom"
+        )
+
 
 class TestGetRomSummary:
     """Tests for the get_rom_summary function."""
@@ -233,6 +316,29 @@ class TestGetRomSummary:
         assert "512 KB" in summary
         assert "12345678" in summary
 
+    def test_summary_exact_layout(self):
+        """Summaries keep their line layout, including missing-field defaults."""
+        identified = {
+            "filename": "kick13.rom",
+            "identified": True,
+            "version": "1.3",
+            "revision": "34.5",
+            "model": "A500/A1000/A2000",
+            "size": 262144,
+            "crc32": "C4F0F55F",
+        }
+
+        assert get_rom_summary(identified) == (
+            "ROM: kick13.rom\n"
+            "Kickstart 1.3 (Rev 34.5)\n"
+            "Model: A500/A1000/A2000\n"
+            "Size: 256 KB\n"
+            "CRC32: C4F0F55F"
+        )
+        assert get_rom_summary({"identified": False}) == (
+            "ROM: Unknown\nSize: 0 KB\nCRC32: Unknown"
+        )
+
 
 class TestFindRomForModel:
     """Tests for the find_rom_for_model function."""
@@ -303,6 +409,20 @@ class TestFindRomForModel:
 
         assert result is not None
 
+    def test_find_with_prebuilt_index(self):
+        """A prebuilt index gives the same answers as the list it came from."""
+        roms = [
+            {"identified": False, "filename": "unknown.rom"},
+            {"identified": True, "model": "A500/A1000/A2000", "version": "1.3"},
+            {"identified": True, "model": "A4000", "version": "3.1"},
+            {"identified": True, "model": "A1200", "version": "3.1"},
+        ]
+        index = build_rom_index(roms)
+
+        assert sorted(index) == ["A1000", "A1200", "A2000", "A4000", "A500"]
+        for model in ("A500", "a1000", "A500+", "A600", "A3000", "A1200", "CD32"):
+            assert find_rom_for_model(index, model) is find_rom_for_model(roms, model)
+
 
 class TestKnownRomsDatabase:
     """Tests for the KNOWN_ROMS database."""
@@ -328,6 +448,19 @@ class TestKnownRomsDatabase:
                 f"Invalid size for {crc}: {info['size']}"
             )
 
+    def test_size_index_covers_database(self):
+        """Every known ROM is reachable through the size index."""
+        from amiberry_mcp.rom_manager import _ROMS_BY_SIZE
+
+        indexed = {
+            crc: info
+            for by_crc in _ROMS_BY_SIZE.values()
+            for crc, info in by_crc.items()
+        }
+        assert indexed == KNOWN_ROMS
+        for size, by_crc in _ROMS_BY_SIZE.items():
+            assert all(info["size"] == size for info in by_crc.values())
+
     def test_kickstart_versions_present(self):
         """Test that common Kickstart versions are present."""
         versions = [info["version"] for info in KNOWN_ROMS.values()]
@@ -377,10 +510,24 @@ class TestRomFileSizeCap:
         with pytest.raises(ValueError, match="too large"):
             identify_rom(test_file)
 
-    def test_normal_rom_accepted(self, tmp_path):
+    def test_read_is_bounded_when_file_grows(self, tmp_path):
+        """A file that grew past the cap after the size check is still rejected."""
+        small = tmp_path / "small.rom"
+        small.write_bytes(b"\x00" * 16)
+        test_file = tmp_path / "growing.rom"
+        test_file.write_bytes(b"\x00" * 1024)
+
+        with (
+            patch("amiberry_mcp.rom_manager._MAX_ROM_SIZE", 512),
+            patch("amiberry_mcp.rom_manager.os.fstat", return_value=small.stat()),
+            pytest.raises(ValueError, match="too large"),
+        ):
+            calculate_rom_crc32(test_file)
+
+    def test_normal_rom_accepted(self, tmp_path, stage_rom):
         """Normal-sized ROM files should work fine."""
-        test_file = tmp_path / "normal.rom"
-        test_file.write_bytes(b"A" * 524288)  # 512KB - typical Kickstart
+        # 512KB - typical Kickstart
+        test_file = stage_rom("512k_Y", tmp_path / "normal.rom")
 
         crc = calculate_rom_crc32(test_file)
         md5 = calculate_rom_md5(test_file)
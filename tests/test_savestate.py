@@ -3,6 +3,7 @@
 Unit tests for the savestate module.
 """
 
+import os
 import struct
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import pytest
 
 from amiberry_mcp.savestate import (
     ASF_MAGIC,
+    _inspect_file,
     _read_string,
     _read_u16_be,
     _read_u32_be,
@@ -180,6 +182,88 @@ class TestInspectSavestate:
         assert "memory" in metadata
         assert metadata["memory"]["chip"] == 2048  # 2MB in KB
 
+    def test_inspect_skips_large_memory_dump(self, tmp_path):
+        """Chunks after a large RAM dump are still parsed."""
+        data = bytearray(ASF_MAGIC)
+        data.extend(struct.pack(">I", 1))
+        data.extend(b"Amiberry\x00v5.7\x00\x00")
+
+        cram_data = struct.pack(">II", 0, 524288) + bytes(256 * 1024)
+        data.extend(b"CRAM")
+        data.extend(struct.pack(">I", 8 + len(cram_data)))
+        data.extend(cram_data)
+
+        data.extend(b"CPU ")
+        data.extend(struct.pack(">III", 16, 30, 0))
+        data.extend(b"END ")
+        data.extend(struct.pack(">I", 8))
+
+        path = tmp_path / "big.uss"
+        path.write_bytes(bytes(data))
+
+        metadata = inspect_savestate(path)
+
+        assert metadata["memory"]["chip"] == 512
+        assert metadata["cpu"]["model"] == "68030"
+        assert metadata["chunks"] == ["CRAM", "CPU ", "END "]
+        assert metadata["size_bytes"] == len(data)
+
+    def test_inspect_survives_truncation_mid_parse(self, tmp_path):
+        """A file truncated after it was opened ends the chunk walk cleanly."""
+        data = bytearray(ASF_MAGIC)
+        data.extend(struct.pack(">I", 1))
+        data.extend(b"Amiberry\x00v5.7\x00\x00")
+        cram_data = struct.pack(">II", 0, 524288) + bytes(256 * 1024)
+        data.extend(b"CRAM")
+        data.extend(struct.pack(">I", 8 + len(cram_data)))
+        data.extend(cram_data)
+        data.extend(b"END ")
+        data.extend(struct.pack(">I", 8))
+
+        path = tmp_path / "shrinking.uss"
+        path.write_bytes(bytes(data))
+
+        with open(path, "rb") as f:
+            os.truncate(path, len(data) // 2)
+            metadata = _inspect_file(path, f, len(data))
+
+        assert metadata["chunks"] == ["CRAM"]
+        assert metadata["memory"]["chip"] == 512
+
+    def test_inspect_parses_each_chunk_type(self, tmp_path):
+        """FPU, ROM, memory and floppy chunks are parsed; short chunks are ignored."""
+        rom_data = struct.pack(">IIIIHHI", 0xF80000, 524288, 0, 0, 40, 68, 0x9FDEEEF6)
+        chunks = [
+            (b"FPU ", struct.pack(">I", 882)),
+            (b"ROM ", rom_data + b"KS3.1\x00"),
+            (b"FRAM", struct.pack(">II", 0, 8 * 1024 * 1024)),
+            (b"DSK1", struct.pack(">IBB", 0, 1, 40) + bytes(14) + b"game.adf\x00"),
+            (b"CHIP", b"\x00\x00"),
+            (b"END ", b""),
+        ]
+        data = bytearray(ASF_MAGIC)
+        data.extend(struct.pack(">I", 1))
+        data.extend(b"Amiberry\x00v5.7\x00\x00")
+        for name, payload in chunks:
+            data.extend(name)
+            data.extend(struct.pack(">I", 8 + len(payload)))
+            data.extend(payload)
+
+        path = tmp_path / "chunks.uss"
+        path.write_bytes(bytes(data))
+
+        metadata = inspect_savestate(path)
+
+        assert metadata["cpu"] == {"fpu": "68882"}
+        assert metadata["rom"]["version"] == 40
+        assert metadata["rom"]["revision"] == 68
+        assert metadata["rom"]["crc"] == "9FDEEEF6"
+        assert metadata["rom"]["id"] == "KS3.1"
+        assert metadata["memory"] == {"chip": 0, "bogo": 0, "fast": 8192, "z3": 0}
+        assert metadata["disks"] == [
+            {"drive": "DF1", "id": 0, "state": 1, "track": 40, "image": "game.adf"}
+        ]
+
     def test_inspect_nonexistent_file(self, tmp_path):
         """Test inspecting a file that doesn't exist."""
         path = tmp_path / "nonexistent.uss"
@@ -272,6 +356,35 @@ class TestGetSavestateSummary:
 
         assert "Level 5 - Boss fight" in summary
 
+    def test_summary_exact_layout(self):
+        """The summary keeps its line layout and defaults."""
+        metadata = {
+            "filename": "full.uss",
+            "size_bytes": 1536,
+            "description": "Title screen",
+            "emulator": "Amiberry",
+            "cpu": {"model": "68000", "chipset": "OCS"},
+            "memory": {"chip": 512, "bogo": 0, "fast": 0, "z3": 0},
+            "rom": {"version": 34, "revision": 5, "crc": "C4F0F55F"},
+            "disks": [
+                {"drive": "DF0", "image": "disk1.adf"},
+                {"drive": "DF1", "state": 1},
+            ],
+        }
+
+        assert get_savestate_summary(metadata) == (
+            "Savestate: full.uss\n"
+            "Size: 1.5 KB\n"
+            "Description: Title screen\n"
+            "Created by: Amiberry\n"
+            "CPU: 68000 (OCS)\n"
+            "Memory: 512KB Chip\n"
+            "Kickstart: v34.5 [CRC: C4F0F55F]\n"
+            "Floppy DF0: disk1.adf\n"
+            "Floppy DF1: (motor on)"
+        )
+        assert get_savestate_summary({}) == "Savestate: Unknown\nSize: 0.0 KB"
+
 
 class TestSavestateFileSizeCap:
     """Tests for Fix #9: Savestate file size cap."""
@@ -345,6 +458,21 @@ class TestListSavestateChunks:
         assert "CRAM" in chunk_names
         assert "END " in chunk_names
 
+    def test_list_chunks_offsets_and_truncation(self, tmp_path):
+        """Offsets advance by chunk size and a truncated chunk ends the walk."""
+        path = self._create_multi_chunk_savestate(tmp_path)
+        data = path.read_bytes()
+        # Drop the END chunk and append a header claiming more data than exists
+        data = data[:-16] + b"BAD " + struct.pack(">I", 1024)
+        path.write_bytes(data)
+
+        chunks = list_savestate_chunks(path)
+
+        assert [c["name"] for c in chunks] == ["CPU ", "FPU ", "CHIP", "CRAM"]
+        first = chunks[0]["offset"]
+        assert [c["offset"] for c in chunks] == [first + 16 * i for i in range(4)]
+        assert all(c["data_size"] == 8 for c in chunks)
+
     def test_list_chunks_nonexistent(self, tmp_path):
         """Test listing chunks for nonexistent file."""
         path = tmp_path / "missing.uss"
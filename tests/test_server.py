@@ -32,11 +32,19 @@ async def test_server():
         print("Server module imported successfully")
         print()
 
+        # The listing tools share no state, so run their I/O concurrently
+        # and print the results in order below.
+        platform_info, configs, disk_images, savestates = await asyncio.gather(
+            call_tool("get_platform_info", {}),
+            call_tool("list_configs", {}),
+            call_tool("list_disk_images", {}),
+            call_tool("list_savestates", {}),
+        )
+
         # Test 1: Check platform info
         print("Test 1: Platform Information")
         print("-" * 50)
-        result = await call_tool("get_platform_info", {})
-        for content in result:
+        for content in platform_info:
             if isinstance(content, TextContent):
                 print(content.text)
         print()
@@ -51,8 +59,7 @@ async def test_server():
         # Test 3: List configurations
         print("Test 3: List Configurations")
         print("-" * 50)
-        result = await call_tool("list_configs", {})
-        for content in result:
+        for content in configs:
             if isinstance(content, TextContent):
                 print(content.text)
         print()
@@ -60,8 +67,7 @@ async def test_server():
         # Test 4: List disk images
         print("Test 4: List Disk Images")
         print("-" * 50)
-        result = await call_tool("list_disk_images", {})
-        for content in result:
+        for content in disk_images:
             if isinstance(content, TextContent):
                 print(content.text)
         print()
@@ -69,8 +75,7 @@ async def test_server():
         # Test 5: List savestates
         print("Test 5: List Savestates")
         print("-" * 50)
-        result = await call_tool("list_savestates", {})
-        for content in result:
+        for content in savestates:
             if isinstance(content, TextContent):
                 print(content.text)
         print()
@@ -107,8 +112,12 @@ async def test_server():
             [(f"Disk image dir {i + 1}", d) for i, d in enumerate(DISK_IMAGE_DIRS)]
         )
 
-        for name, path in dirs_to_check:
-            if path.exists():
+        # Stat the directories concurrently; they may be on slow network shares
+        exists = await asyncio.gather(
+            *(asyncio.to_thread(path.exists) for _, path in dirs_to_check)
+        )
+        for (name, path), found in zip(dirs_to_check, exists, strict=True):
+            if found:
                 print(f"[OK] {name} exists: {path}")
             else:
                 print(f"[--] {name} NOT found: {path}")
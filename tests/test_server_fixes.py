@@ -5,10 +5,15 @@ Unit tests for server.py fixes.
 Covers:
 - Fix #4: _launch_and_store helper centralizes launch pattern
 - Fix #16: Warp mode uses explicit enable/disable strings
+- Constant no-argument tool results are pre-built
+- Required tool arguments are validated by the SDK before dispatch
+- Key/value result formatting
+- Combined runtime state dump
+- Large disassemblies split into TextContent chunks
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -56,6 +61,41 @@ class TestLaunchAndStore:
 
         mock_close.assert_called_once()
 
+    def test_concurrent_launches_do_not_interleave(self):
+        """Launches from worker threads run one at a time."""
+        import threading
+        import time
+
+        from amiberry_mcp.shared_state import ProcessState, launch_and_store
+
+        state = ProcessState()
+        active = 0
+        overlaps = []
+
+        def fake_launch(cmd, log_path=None):
+            nonlocal active
+            active += 1
+            overlaps.append(active)
+            time.sleep(0.01)
+            active -= 1
+            return MagicMock(), MagicMock()
+
+        with patch("amiberry_mcp.shared_state.launch_process", fake_launch):
+            threads = [
+                threading.Thread(
+                    target=launch_and_store,
+                    args=([f"cmd{i}"],),
+                    kwargs={"state": state},
+                )
+                for i in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert max(overlaps) == 1
+
 
 class TestWarpModeStrings:
     """Tests for Fix #16: Warp mode status/action strings."""
@@ -136,5 +176,174 @@ class TestWarpModeStrings:
             assert any("enable" in str(r.text) for r in result)
 
 
+class TestConstantResults:
+    """Tests for pre-built TextContent results on constant messages."""
+
+    @pytest.mark.asyncio
+    async def test_no_arg_handler_reuses_text_content(self):
+        """Repeated calls should return the same pre-built TextContent."""
+        from amiberry_mcp.server import _handle_no_arg_bool
+
+        mock_client = MagicMock()
+        mock_client.toggle_mouse_grab = AsyncMock(return_value=True)
+
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=mock_client):
+            first = await _handle_no_arg_bool("runtime_toggle_mouse_grab", {})
+            second = await _handle_no_arg_bool("runtime_toggle_mouse_grab", {})
+
+        assert first[0].text == "Mouse grab toggled."
+        assert first[0] is second[0]
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_state_failure_reuses_text_content(self):
+        """Constant failure messages from state queries are pre-built."""
+        from amiberry_mcp.server import _handle_runtime_get_copper_state
+
+        mock_client = MagicMock()
+        mock_client.get_copper_state = AsyncMock(return_value=None)
+
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=mock_client):
+            first = await _handle_runtime_get_copper_state({})
+            second = await _handle_runtime_get_copper_state({})
+
+        assert first[0].text == "Failed to get Copper state."
+        assert first[0] is second[0]
+
+
+class TestRequiredArguments:
+    """Tests for SDK inputSchema validation ahead of call_tool."""
+
+    @pytest.mark.asyncio
+    async def test_missing_required_argument_rejected(self):
+        """A missing required argument should fail before any IPC call."""
+        from mcp import types
+
+        from amiberry_mcp.server import app
+
+        handler = app.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="runtime_set_cpu_speed", arguments={}
+            ),
+        )
+        with patch("amiberry_mcp.server.get_ipc_client") as mock_get_client:
+            result = await handler(request)
+
+        assert result.root.isError
+        assert "speed" in result.root.content[0].text
+        mock_get_client.assert_not_called()
+
+
+class TestFormatKv:
+    """Tests for the _format_kv result builder."""
+
+    def test_formats_header_and_items(self):
+        """Each item should be an indented key: value line."""
+        from amiberry_mcp.server import _format_kv
+
+        result = _format_kv(
+            "Copper State:\n", {"COP1LC": "1000", "enabled": "1"}.items()
+        )
+
+        assert result == "Copper State:\n  COP1LC: 1000\n  enabled: 1\n"
+
+    def test_empty_items_returns_header(self):
+        """No items should leave just the header."""
+        from amiberry_mcp.server import _format_kv
+
+        assert _format_kv("DMA State:\n", []) == "DMA State:\n"
+
+
+class TestDumpAllState:
+    """Tests for the combined runtime_dump_all_state tool."""
+
+    @staticmethod
+    def _client(**overrides):
+        client = MagicMock()
+        for method in (
+            "get_copper_state",
+            "get_blitter_state",
+            "get_dma_state",
+            "get_audio_state",
+            "get_drive_state",
+        ):
+            setattr(client, method, AsyncMock(return_value={"value": method}))
+        for method, mock in overrides.items():
+            setattr(client, method, mock)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_combines_all_sections(self):
+        """Every subsystem should appear once in the combined result."""
+        from amiberry_mcp.server import _handle_runtime_dump_all_state
+
+        client = self._client()
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=client):
+            result = await _handle_runtime_dump_all_state({})
+
+        text = result[0].text
+        for label in ("Copper", "Blitter", "DMA", "Audio", "Drive"):
+            assert f"{label} State:" in text
+        client.get_drive_state.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_other_sections(self):
+        """A failing query should not hide the sections that succeeded."""
+        from amiberry_mcp.server import _handle_runtime_dump_all_state
+
+        client = self._client(
+            get_audio_state=AsyncMock(side_effect=RuntimeError("boom")),
+            get_drive_state=AsyncMock(return_value=None),
+        )
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=client):
+            result = await _handle_runtime_dump_all_state({})
+
+        text = result[0].text
+        assert "Audio State:\n  Error: boom" in text
+        assert "Drive State:\n  Unavailable" in text
+        assert "value: get_dma_state" in text
+
+
+class TestDisassemblyChunks:
+    """Tests for chunked runtime_disassemble output."""
+
+    @pytest.mark.asyncio
+    async def test_small_disassembly_is_one_block(self):
+        """Short listings keep the single header-plus-lines block."""
+        from amiberry_mcp.server import _handle_runtime_disassemble
+
+        client = MagicMock()
+        client.disassemble = AsyncMock(return_value=["NOP", "RTS"])
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=client):
+            result = await _handle_runtime_disassemble({"address": "0xFC0000"})
+
+        assert len(result) == 1
+        assert result[0].text == "Disassembly at 0xFC0000:\n  NOP\n  RTS\n"
+
+    @pytest.mark.asyncio
+    async def test_large_disassembly_split_into_blocks(self):
+        """Long listings are split with the header only on the first block."""
+        from amiberry_mcp.server import (
+            _DISASSEMBLY_CHUNK_LINES,
+            _handle_runtime_disassemble,
+        )
+
+        lines = [f"NOP ; {i}" for i in range(_DISASSEMBLY_CHUNK_LINES * 2 + 1)]
+        client = MagicMock()
+        client.disassemble = AsyncMock(return_value=lines)
+        with patch("amiberry_mcp.server.get_ipc_client", return_value=client):
+            result = await _handle_runtime_disassemble(
+                {"address": "0xFC0000", "count": len(lines)}
+            )
+
+        assert len(result) == 3
+        assert result[0].text.startswith("Disassembly at 0xFC0000:\n")
+        assert not result[1].text.startswith("Disassembly")
+        text = "".join(block.text for block in result)
+        assert text.count("  NOP ; ") == len(lines)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
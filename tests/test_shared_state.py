@@ -5,6 +5,7 @@ Unit tests for the shared_state module.
 Covers:
 - ProcessState dataclass behaviour
 - get_ipc_client caching
+- close_ipc_client shutdown
 - launch_and_store state management
 - State lock availability
 """
@@ -13,7 +14,7 @@ import asyncio
 import platform
 import subprocess
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -62,6 +63,7 @@ if platform.system() not in ("Darwin", "Linux"):
 
 from amiberry_mcp.shared_state import (
     ProcessState,
+    close_ipc_client,
     get_ipc_client,
     get_state,
     get_state_lock,
@@ -146,7 +148,7 @@ class TestGetIpcClient:
             mock_cls.return_value = MagicMock()
             client = get_ipc_client(state)
 
-            mock_cls.assert_called_once_with(prefer_dbus=False, instance=None)
+            mock_cls.assert_called_once_with(instance=None)
             assert client is mock_cls.return_value
 
     def test_returns_cached_client(self):
@@ -184,6 +186,30 @@ class TestGetIpcClient:
             assert client is not None
 
 
+class TestCloseIpcClient:
+    """Tests for close_ipc_client."""
+
+    @pytest.mark.asyncio
+    async def test_closes_and_clears_cached_client(self):
+        """Should close the cached client and empty the cache."""
+        state = ProcessState()
+        mock_client = MagicMock()
+        mock_client.close = AsyncMock()
+        state.ipc_client_cache = (None, mock_client)
+
+        await close_ipc_client(state)
+
+        mock_client.close.assert_awaited_once()
+        assert state.ipc_client_cache is None
+
+    @pytest.mark.asyncio
+    async def test_no_cached_client_is_noop(self):
+        """Should do nothing when no client is cached."""
+        state = ProcessState()
+        await close_ipc_client(state)
+        assert state.ipc_client_cache is None
+
+
 class TestLaunchAndStore:
     """Tests for launch_and_store."""
 
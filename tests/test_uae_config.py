@@ -3,11 +3,15 @@
 Unit tests for the uae_config module.
 """
 
+import os
+import re
 from pathlib import Path
 
 import pytest
 
 from amiberry_mcp.uae_config import (
+    _TEMPLATES,
+    _parse_uae_lines,
     create_config_from_template,
     get_config_summary,
     modify_uae_config,
@@ -15,54 +19,91 @@ from amiberry_mcp.uae_config import (
     write_uae_config,
 )
 
+# Config file contents written by the modify tests
+_CPU_CHIPSET = b"cpu_model=68000\nchipset=ocs\n"
+_CPU_ONLY = b"cpu_model=68000\n"
+_SECTION_COMMENTS = b"; CPU Settings\ncpu_model=68000\n; Chipset\nchipset=ocs\n"
+_BLANK_LINES = b"cpu_model=68000\n\nchipset=ocs\n\nsound_output=exact\n"
+_KEY_ORDER = b"chipset=ocs\ncpu_model=68000\nsound_output=exact\n"
+_SETTINGS_COMMENT = b"; Settings\ncpu_model=68000\nchipset=ocs\nsound=exact\n"
+_HASH_COMMENT = b"# Hash comment\ncpu_model=68000\n"
+
+# Expected write_uae_config output: a leading comment header naming the
+# generator, then the CPU group ahead of the chipset group
+_WRITE_HEADER_RE = re.compile(rb"\A;.*?amiberry-mcp-server", re.IGNORECASE | re.DOTALL)
+_WRITE_SIMPLE_RE = re.compile(
+    rb"\A;.*?amiberry-mcp-server.*?^cpu_model=68000$.*?^chipset=ocs$",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
 
-class TestParseUaeConfig:
-    """Tests for parse_uae_config function."""
-
-    def test_parse_simple_config(self, tmp_path: Path):
-        """Test parsing a simple config file."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\nchipmem_size=2\n")
-
-        config = parse_uae_config(config_file)
-
-        assert config["cpu_model"] == "68000"
-        assert config["chipmem_size"] == "2"
-
-    def test_parse_config_with_comments(self, tmp_path: Path):
-        """Test that comments are ignored."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text(
-            "; This is a comment\ncpu_model=68020\n# Another comment\nchipset=aga\n"
-        )
-
-        config = parse_uae_config(config_file)
-
-        assert config["cpu_model"] == "68020"
-        assert config["chipset"] == "aga"
-        assert len(config) == 2
 
-    def test_parse_config_with_empty_lines(self, tmp_path: Path):
-        """Test that empty lines are ignored."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\n\n\nchipset=ocs\n")
+@pytest.fixture(scope="module")
+def uae_dir(tmp_path_factory) -> Path:
+    """One temp directory shared by every test in this module."""
+    return tmp_path_factory.mktemp("uae")
 
-        config = parse_uae_config(config_file)
 
-        assert len(config) == 2
+@pytest.fixture
+def uae_file(uae_dir: Path, request) -> Path:
+    """A config path unique to the requesting test, not yet created."""
+    return uae_dir / f"{request.node.name}.uae"
 
-    def test_parse_config_with_values_containing_equals(self, tmp_path: Path):
-        """Test parsing values that contain equals signs."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("path=/some/path=with=equals\n")
 
-        config = parse_uae_config(config_file)
+class TestParseUaeConfig:
+    """Tests for parse_uae_config function."""
 
-        assert config["path"] == "/some/path=with=equals"
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param(
+                "cpu_model=68000\nchipmem_size=2\n",
+                {"cpu_model": "68000", "chipmem_size": "2"},
+                id="simple",
+            ),
+            pytest.param(
+                "; This is a comment\ncpu_model=68020\n# Another comment\nchipset=aga\n",
+                {"cpu_model": "68020", "chipset": "aga"},
+                id="comments",
+            ),
+            pytest.param(
+                "cpu_model=68000\n\n\nchipset=ocs\n",
+                {"cpu_model": "68000", "chipset": "ocs"},
+                id="empty_lines",
+            ),
+            pytest.param(
+                "path=/some/path=with=equals\n",
+                {"path": "/some/path=with=equals"},
+                id="equals_in_value",
+            ),
+            pytest.param(
+                "  cpu_model = 68020  \nnot an option\n\t; indented comment\n",
+                {"cpu_model": "68020"},
+                id="whitespace_and_bare_words",
+            ),
+        ],
+    )
+    def test_parse(self, text, expected):
+        """Test parsing key=value lines, skipping comments and blank lines."""
+        assert _parse_uae_lines(text.splitlines()) == expected
+
+    def test_parse_file_decodes_utf8(self, uae_file: Path):
+        """Test that config files are read as UTF-8."""
+        uae_file.write_bytes("floppy0=/home/jörg/disk.adf\n".encode())
+
+        assert parse_uae_config(uae_file) == {"floppy0": "/home/jörg/disk.adf"}
+
+    def test_parse_file_splits_only_on_newlines(self, uae_file: Path):
+        """Form feeds and Unicode separators stay inside values."""
+        uae_file.write_bytes("description=A\x0cB\u2028C\r\nchipset=ocs\n".encode())
+
+        assert parse_uae_config(uae_file) == {
+            "description": "A\x0cB\u2028C",
+            "chipset": "ocs",
+        }
 
-    def test_parse_nonexistent_file(self, tmp_path: Path):
+    def test_parse_nonexistent_file(self, uae_file: Path):
         """Test that FileNotFoundError is raised for missing files."""
-        config_file = tmp_path / "nonexistent.uae"
+        config_file = uae_file
 
         with pytest.raises(FileNotFoundError):
             parse_uae_config(config_file)
@@ -71,65 +112,75 @@ class TestParseUaeConfig:
 class TestWriteUaeConfig:
     """Tests for write_uae_config function."""
 
-    def test_write_simple_config(self, tmp_path: Path):
+    def test_write_simple_config(self, uae_file: Path):
         """Test writing a simple config file."""
-        config_file = tmp_path / "test.uae"
+        config_file = uae_file
         config = {"cpu_model": "68000", "chipset": "ocs"}
 
         write_uae_config(config_file, config)
 
-        content = config_file.read_text()
-        assert "cpu_model=68000" in content
-        assert "chipset=ocs" in content
+        assert _WRITE_SIMPLE_RE.search(config_file.read_bytes())
+
+    def test_write_groups_options_into_sections(self, uae_file: Path):
+        """Options are sorted into commented sections in a fixed order."""
+        config = {"sound_output": "exact", "cpu_model": "68000", "foo": "1"}
+
+        write_uae_config(uae_file, config)
 
-    def test_write_creates_parent_directories(self, tmp_path: Path):
+        assert uae_file.read_text() == (
+            "; Amiberry configuration file\n"
+            "; Generated by amiberry-mcp-server\n\n"
+            "; CPU\ncpu_model=68000\n\n"
+            "; Sound\nsound_output=exact\n\n"
+            "; Other Settings\nfoo=1\n\n"
+        )
+
+    def test_write_creates_parent_directories(self, uae_file: Path):
         """Test that parent directories are created if needed."""
-        config_file = tmp_path / "subdir" / "test.uae"
+        config_file = uae_file.with_suffix("") / "test.uae"
         config = {"cpu_model": "68000"}
 
         write_uae_config(config_file, config)
 
         assert config_file.exists()
 
-    def test_write_includes_header_comment(self, tmp_path: Path):
+    def test_write_includes_header_comment(self, uae_file: Path):
         """Test that header comments are included."""
-        config_file = tmp_path / "test.uae"
+        config_file = uae_file
         config = {"cpu_model": "68000"}
 
         write_uae_config(config_file, config)
 
-        content = config_file.read_text()
-        assert content.startswith(";")
-        assert "amiberry-mcp-server" in content.lower()
+        assert _WRITE_HEADER_RE.match(config_file.read_bytes())
 
 
 class TestModifyUaeConfig:
     """Tests for modify_uae_config function."""
 
-    def test_modify_existing_option(self, tmp_path: Path):
+    def test_modify_existing_option(self, uae_file: Path):
         """Test modifying an existing option."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\nchipset=ocs\n")
+        config_file = uae_file
+        config_file.write_bytes(_CPU_CHIPSET)
 
         result = modify_uae_config(config_file, {"cpu_model": "68020"})
 
         assert result["cpu_model"] == "68020"
         assert result["chipset"] == "ocs"
 
-    def test_add_new_option(self, tmp_path: Path):
+    def test_add_new_option(self, uae_file: Path):
         """Test adding a new option."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\n")
+        config_file = uae_file
+        config_file.write_bytes(_CPU_ONLY)
 
         result = modify_uae_config(config_file, {"chipset": "aga"})
 
         assert result["cpu_model"] == "68000"
         assert result["chipset"] == "aga"
 
-    def test_remove_option(self, tmp_path: Path):
+    def test_remove_option(self, uae_file: Path):
         """Test removing an option by setting it to None."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\nchipset=ocs\n")
+        config_file = uae_file
+        config_file.write_bytes(_CPU_CHIPSET)
 
         result = modify_uae_config(config_file, {"chipset": None})
 
@@ -140,38 +191,32 @@ class TestModifyUaeConfig:
 class TestCreateConfigFromTemplate:
     """Tests for create_config_from_template function."""
 
-    def test_create_a500_config(self, tmp_path: Path):
-        """Test creating an A500 config."""
-        config_file = tmp_path / "test.uae"
+    def test_create_writes_config_file(self, uae_file: Path):
+        """Test that creating a config writes it to disk."""
+        config_file = uae_file
 
         config = create_config_from_template(config_file, "A500")
 
-        assert config["cpu_model"] == "68000"
-        assert config["chipset"] == "ocs"
         assert config_file.exists()
-
-    def test_create_a1200_config(self, tmp_path: Path):
-        """Test creating an A1200 config."""
-        config_file = tmp_path / "test.uae"
-
-        config = create_config_from_template(config_file, "A1200")
-
-        assert config["cpu_model"] == "68020"
-        assert config["chipset"] == "aga"
-
-    def test_create_cd32_config(self, tmp_path: Path):
-        """Test creating a CD32 config."""
-        config_file = tmp_path / "test.uae"
-
-        config = create_config_from_template(config_file, "CD32")
-
-        assert config["cpu_model"] == "68020"
-        assert config["chipset"] == "aga"
-        assert config["cd32cd"] == "true"
-
-    def test_create_config_with_overrides(self, tmp_path: Path):
+        assert parse_uae_config(config_file) == config
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("A500", {"cpu_model": "68000", "chipset": "ocs"}),
+            ("A1200", {"cpu_model": "68020", "chipset": "aga"}),
+            ("CD32", {"cpu_model": "68020", "chipset": "aga", "cd32cd": "true"}),
+        ],
+    )
+    def test_create_config(self, parsed_templates, model, expected):
+        """Test the settings each built-in template provides."""
+        config = parsed_templates[model]
+
+        assert expected.items() <= config.items()
+
+    def test_create_config_with_overrides(self, uae_file: Path):
         """Test creating a config with custom overrides."""
-        config_file = tmp_path / "test.uae"
+        config_file = uae_file
 
         config = create_config_from_template(
             config_file, "A500", {"chipmem_size": "4", "fastmem_size": "4096"}
@@ -181,9 +226,19 @@ class TestCreateConfigFromTemplate:
         assert config["chipmem_size"] == "4"  # Override
         assert config["fastmem_size"] == "4096"  # Override
 
-    def test_create_config_invalid_template(self, tmp_path: Path):
+    def test_create_does_not_mutate_shared_template(self, uae_file: Path):
+        """Overrides apply to a copy, never to the shared template."""
+        config = create_config_from_template(uae_file, "A500", {"cpu_model": "68030"})
+        config["chipset"] = "aga"
+
+        assert _TEMPLATES["A500"]["cpu_model"] == "68000"
+        assert _TEMPLATES["A500"]["chipset"] == "ocs"
+        with pytest.raises(TypeError):
+            _TEMPLATES["A500"]["cpu_model"] = "68030"  # type: ignore[index]
+
+    def test_create_config_invalid_template(self, uae_file: Path):
         """Test that invalid template raises ValueError."""
-        config_file = tmp_path / "test.uae"
+        config_file = uae_file
 
         with pytest.raises(ValueError):
             create_config_from_template(config_file, "InvalidModel")
@@ -192,12 +247,10 @@ class TestCreateConfigFromTemplate:
 class TestModifyPreservesStructure:
     """Tests for Fix #7: modify_uae_config preserves file structure."""
 
-    def test_preserves_comments(self, tmp_path: Path):
+    def test_preserves_comments(self, uae_file: Path):
         """Comments should be preserved after modification."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text(
-            "; CPU Settings\ncpu_model=68000\n; Chipset\nchipset=ocs\n"
-        )
+        config_file = uae_file
+        config_file.write_bytes(_SECTION_COMMENTS)
 
         modify_uae_config(config_file, {"cpu_model": "68020"})
 
@@ -205,10 +258,10 @@ class TestModifyPreservesStructure:
         assert "; CPU Settings" in content
         assert "; Chipset" in content
 
-    def test_preserves_blank_lines(self, tmp_path: Path):
+    def test_preserves_blank_lines(self, uae_file: Path):
         """Blank lines should be preserved after modification."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\n\nchipset=ocs\n\nsound_output=exact\n")
+        config_file = uae_file
+        config_file.write_bytes(_BLANK_LINES)
 
         modify_uae_config(config_file, {"chipset": "aga"})
 
@@ -217,10 +270,10 @@ class TestModifyPreservesStructure:
         # Blank lines should still be present
         assert "" in lines
 
-    def test_preserves_key_ordering(self, tmp_path: Path):
+    def test_preserves_key_ordering(self, uae_file: Path):
         """Keys should remain in their original order."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("chipset=ocs\ncpu_model=68000\nsound_output=exact\n")
+        config_file = uae_file
+        config_file.write_bytes(_KEY_ORDER)
 
         modify_uae_config(config_file, {"cpu_model": "68020"})
 
@@ -229,10 +282,10 @@ class TestModifyPreservesStructure:
         keys = [line.split("=")[0] for line in lines]
         assert keys == ["chipset", "cpu_model", "sound_output"]
 
-    def test_new_keys_appended_at_end(self, tmp_path: Path):
+    def test_new_keys_appended_at_end(self, uae_file: Path):
         """New keys should be appended at the end of the file."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("cpu_model=68000\nchipset=ocs\n")
+        config_file = uae_file
+        config_file.write_bytes(_CPU_CHIPSET)
 
         modify_uae_config(config_file, {"new_key": "new_value"})
 
@@ -240,12 +293,10 @@ class TestModifyPreservesStructure:
         lines = [line for line in content.strip().split("\n") if line and "=" in line]
         assert lines[-1] == "new_key=new_value"
 
-    def test_removed_keys_leave_no_trace(self, tmp_path: Path):
+    def test_removed_keys_leave_no_trace(self, uae_file: Path):
         """Removed keys (None value) should be completely gone."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text(
-            "; Settings\ncpu_model=68000\nchipset=ocs\nsound=exact\n"
-        )
+        config_file = uae_file
+        config_file.write_bytes(_SETTINGS_COMMENT)
 
         result = modify_uae_config(config_file, {"chipset": None})
 
@@ -255,10 +306,41 @@ class TestModifyPreservesStructure:
         assert "sound=exact" in content
         assert "chipset" not in result
 
-    def test_preserves_hash_comments(self, tmp_path: Path):
+    def test_result_matches_file(self, uae_file: Path):
+        """The returned config matches a fresh parse of the rewritten file."""
+        uae_file.write_bytes(_SETTINGS_COMMENT)
+
+        result = modify_uae_config(
+            uae_file, {"chipset": "aga", "sound": None, "new_key": " spaced "}
+        )
+
+        assert result == parse_uae_config(uae_file)
+        assert result == {"cpu_model": "68000", "chipset": "aga", "new_key": "spaced"}
+
+    def test_unchanged_file_not_rewritten(self, uae_file: Path):
+        """Modifications that change nothing leave the file alone."""
+        uae_file.write_bytes(_CPU_CHIPSET)
+        os.utime(uae_file, ns=(1_000_000_000, 1_000_000_000))
+
+        for modifications in ({}, {"chipset": "ocs"}, {"missing": None}):
+            result = modify_uae_config(uae_file, modifications)
+
+            assert result == {"cpu_model": "68000", "chipset": "ocs"}
+            assert uae_file.stat().st_mtime_ns == 1_000_000_000
+
+    def test_form_feed_in_value_is_not_a_line_break(self, uae_file: Path):
+        """Only newlines end a line; other separators stay in the value."""
+        uae_file.write_bytes(b"description=A\x0cB\nchipset=ocs\n")
+
+        result = modify_uae_config(uae_file, {"chipset": "aga"})
+
+        assert uae_file.read_bytes() == b"description=A\x0cB\nchipset=aga\n"
+        assert result == {"description": "A\x0cB", "chipset": "aga"}
+
+    def test_preserves_hash_comments(self, uae_file: Path):
         """Hash-style comments should also be preserved."""
-        config_file = tmp_path / "test.uae"
-        config_file.write_text("# Hash comment\ncpu_model=68000\n")
+        config_file = uae_file
+        config_file.write_bytes(_HASH_COMMENT)
 
         modify_uae_config(config_file, {"cpu_model": "68020"})
 
@@ -287,6 +369,21 @@ class TestGetConfigSummary:
         assert summary["memory"]["chip_kb"] == 2048  # 4 * 512
         assert summary["memory"]["fast_kb"] == 8192  # Already in KB
 
+    def test_summary_memory_defaults(self):
+        """Missing or invalid memory sizes fall back to the defaults."""
+        invalid = {"chipmem_size": "lots", "fastmem_size": "?"}
+
+        assert get_config_summary({})["memory"] == {"chip_kb": 512, "fast_kb": 0}
+        assert get_config_summary(invalid)["memory"] == {"chip_kb": 512, "fast_kb": 0}
+
+    def test_summary_hardfile_info(self):
+        """Test hard drives from both hardfile2 and legacy uaehf keys."""
+        config = {"hardfile2_0": "rw,DH0:/hd/sys.hdf", "uaehf1": "dir,rw,DH1:/hd/work"}
+
+        summary = get_config_summary(config)
+
+        assert summary["hardfiles"] == ["rw,DH0:/hd/sys.hdf", "dir,rw,DH1:/hd/work"]
+
     def test_summary_floppy_info(self):
         """Test floppy info in summary."""
         config = {
@@ -300,6 +397,14 @@ class TestGetConfigSummary:
         assert summary["floppies"][0]["drive"] == "DF0"
         assert summary["floppies"][0]["image"] == "/path/to/disk1.adf"
 
+    def test_summary_floppy_gap(self):
+        """An empty drive does not hide the drives after it."""
+        config = {"floppy0": "", "floppy2": "/path/to/disk3.adf"}
+
+        summary = get_config_summary(config)
+
+        assert summary["floppies"] == [{"drive": "DF2", "image": "/path/to/disk3.adf"}]
+
     def test_summary_graphics_info(self):
         """Test graphics info in summary."""
         config = {